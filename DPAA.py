@@ -1,20 +1,42 @@
+import base64
+import csv
+import html
 import json
+import logging
+import os
+import random
+import sqlite3
 import re
 import io
-import base64
+import hashlib
+import tempfile
+import time
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
 from typing import List, Optional
 from urllib.parse import urlparse, parse_qs
 
+import httplib2
 import pandas as pd
 import streamlit as st
+from openpyxl.styles.numbers import is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import from_excel
+from pandas.io.parsers import TextParser
+from google_auth_httplib2 import AuthorizedHttp
+from PIL import Image
 from streamlit.components.v1 import iframe as st_iframe
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.errors import HttpError
 
 # ─────────────────────────────────────────────────────────────
 # 기본 설정 & 스타일
 # ─────────────────────────────────────────────────────────────
+logger = logging.getLogger("dpaa")
+
 PAGE_TITLE = "드라마 인사이트랩"
 PAGE_ICON = "🔬"
 
@@ -318,15 +340,38 @@ a.analysis-card {
 /* =========================================
    PDF 및 슬라이드 컨테이너 스타일
 ========================================= */
-/* PDF 개별 페이지 이미지 (테두리 추가) */
-.pdf-page-img {
+/* PDF 개별 페이지 (테두리 추가) */
+.pdf-page-frame {
     width: 100%;
-    display: block;
     border: 1px solid #d4d4d4; /* 너무 진하지 않은 부드러운 테두리 */
     box-shadow: 0 4px 12px rgba(0,0,0,0.06); /* 페이지 간 구분용 가벼운 그림자 */
     margin-bottom: 30px; /* 페이지 사이 간격 넓게 확보 */
     border-radius: 6px; /* 끝부분 살짝 둥글게 */
+    overflow: hidden;
     background-color: #ffffff;
+    background-size: cover; /* 저해상도 미리보기를 먼저 보여주고 원본이 로드되면 덮어씀 */
+}
+.pdf-page-img {
+    width: 100%;
+    height: 100%;
+    display: block;
+}
+
+/* PDF 뷰어 컨테이너 (회색 배경, 넉넉한 여백) – 페이지 단위 렌더링을 위해 st.container(key=...)에 적용 */
+[class*="st-key-pdf-viewer-"] {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: #f9f9f9;
+    padding: 40px;
+    border-radius: 16px;
+    border: 1px solid #eaeaea;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.03);
+}
+
+/* PDF 내보내기 방식 슬라이드 뷰어 (viewer-wrapper와 동일한 가로폭 제한) */
+[class*="st-key-slide-viewer-"] {
+    max-width: 1200px;
+    margin: 0 auto;
 }
 
 /* 슬라이드 썸네일 전용 임베드 컨테이너 */
@@ -377,8 +422,10 @@ st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 params = st.query_params
 VIEW = params.get("view", "home")
 ROW_ID = params.get("id", None)
+PAGE_PARAM = params.get("page", None)  # 본문 검색 결과에서 특정 페이지만 열 때 (1부터 시작)
 
 ARCHIVE_SHEET_URL = st.secrets.get("ARCHIVE_SHEET_URL", "")
+MONTHLY_SHEET_NAME = "월간 드라마인사이트"
 
 # 홈 카드 배경 이미지(Secrets)
 HOME_IMG1 = st.secrets.get("img1", "")
@@ -387,6 +434,28 @@ HOME_IMG2 = st.secrets.get("img2", "")
 
 APP_BASE_URL = "https://dmkt-insight.streamlit.app"
 
+# 시트 스냅샷 갱신 주기 / 갱신 실패 시 재시도 간격(초)
+SHEET_REFRESH_SECONDS = 300
+SHEET_RETRY_SECONDS = 60
+
+# 렌더링 결과 디스크 캐시 위치 / 용량 상한(Secrets, MB)
+CACHE_DIR = Path(st.secrets.get("CACHE_DIR", "") or os.path.join(tempfile.gettempdir(), "dpaa_cache"))
+PAGE_CACHE_MAX_BYTES = int(st.secrets.get("PAGE_CACHE_MAX_MB", 512)) * 1024 * 1024
+# PDF 원본 캐시 용량 상한(Secrets, MB) – 메모리가 아닌 디스크 파일로 보관하고 총 용량 기준 LRU로 정리
+PDF_CACHE_MAX_BYTES = int(st.secrets.get("PDF_CACHE_MAX_MB", 1024)) * 1024 * 1024
+# 리비전을 모르는 PDF 원본(메타데이터 조회 실패 등)을 다시 받지 않고 재사용하는 시간
+PDF_UNVERSIONED_TTL_SECONDS = 300
+# 이 시간 동안 기록이 없는 임시 파일(중단된 다운로드 조각 등)은 디스크 캐시 정리 대상에 포함
+DISK_CACHE_STALE_TMP_SECONDS = 1800
+# 저장할 때마다 디렉터리를 훑지 않고, 기록한 용량을 누적하다가 상한을 넘거나 이 시간이 지나면 다시 훑음
+DISK_CACHE_RESCAN_SECONDS = 60
+
+# 정적 파일 서빙(.streamlit/config.toml → server.enableStaticServing) 경로
+# static 폴더가 1GB를 넘으면 Streamlit이 서빙을 꺼버리므로 PAGE_CACHE_MAX_MB는 그보다 작게 유지
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_ASSET_DIR = STATIC_DIR / "assets"
+STATIC_URL_PREFIX = "app/static"
+
 def _norm_text(v) -> str:
     if v is None:
         return ""
@@ -403,18 +472,116 @@ def make_stable_key(*parts: str) -> str:
     raw = re.sub(r"-+", "-", raw).strip("-")
     return raw[:220]
 
+def make_stable_keys(prefix: str, *cols: pd.Series) -> pd.Series:
+    """make_stable_key의 열 단위(벡터화) 버전. 행마다 make_stable_key(prefix, *값)과 바이트 단위로 같은 키를 만듭니다.
+    (기존 공유 링크가 계속 열리도록 정규화 규칙을 바꾸면 안 됨)
+    object dtype을 유지해 pyarrow 문자열 dtype(다른 lower/정규식 규칙)이 아닌 파이썬 str/re 동작을 그대로 사용합니다."""
+    joined = pd.Series(_norm_text(prefix), index=cols[0].index, dtype=object)
+    for col in cols:
+        norm = col.astype(str).astype(object).str.strip()
+        norm = norm.mask(col.isna() | (norm.str.lower() == "nan"), "")
+        sep = pd.Series("", index=col.index, dtype=object).mask((joined != "") & (norm != ""), "|")
+        joined = joined + sep + norm
+    raw = joined.str.lower()
+    raw = raw.str.replace(r"\s+", "-", regex=True)
+    raw = raw.str.replace(r"[^0-9a-z가-힣_-]+", "-", regex=True)
+    raw = raw.str.replace(r"-+", "-", regex=True).str.strip("-")
+    return raw.str[:220]
+
+def compute_data_version(df: pd.DataFrame) -> str:
+    """데이터 내용이 같으면 같은 값을 갖는 버전 문자열 (인덱스 등 파생 캐시의 키로 사용)"""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes()).hexdigest()
+
+def get_data_version(df: pd.DataFrame) -> str:
+    return df.attrs.get("data_version") or compute_data_version(df)
+
+def _id_alias_path(stable_col: str) -> Path:
+    return CACHE_DIR / "id_aliases" / f"{stable_col}.json"
+
+def _load_id_aliases(stable_col: str) -> dict:
+    """{"row_ids": 과거 row_id → 처음 본 stable id, "renamed": 바뀐 stable id → 새 stable id}"""
+    try:
+        data = json.loads(_id_alias_path(stable_col).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"row_ids": {}, "renamed": {}}
+    if "row_ids" not in data:  # 예전 형식: row_id → stable id 평면 사전
+        return {"row_ids": data, "renamed": {}}
+    return {"row_ids": data.get("row_ids", {}), "renamed": data.get("renamed", {})}
+
+def _save_id_aliases(stable_col: str, aliases: dict):
+    path = _id_alias_path(stable_col)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(aliases, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_identifier_index(_df: pd.DataFrame, data_version: str, stable_col: str) -> dict:
+    """row_id / stable id → 행 위치 해시 인덱스 (데이터 버전마다 한 번만 생성)
+
+    aliases["row_ids"]는 row_id가 처음 발급될 때 가리키던 stable id 기록입니다. 행 순서가 바뀌어도
+    예전 row_id 링크가 원래 리포트로 연결되도록 처음 본 값을 덮어쓰지 않고 디스크에 누적합니다.
+    aliases["renamed"]는 같은 자리의 행이 수정되어 stable id가 바뀐 경우의 옛 id → 새 id 기록입니다."""
+    by_row_id = {}
+    by_stable = {}
+    for pos, (row_id, stable_id) in enumerate(zip(_df["row_id"], _df[stable_col])):
+        by_row_id.setdefault(row_id, pos)
+        if stable_id:
+            by_stable.setdefault(stable_id, pos)
+
+    aliases = _load_id_aliases(stable_col)
+    row_ids, renamed = aliases["row_ids"], aliases["renamed"]
+    known = set(row_ids.values()) | set(renamed) | set(renamed.values())
+    changed = False
+    for row_id, stable_id in zip(_df["row_id"], _df[stable_col]):
+        if not stable_id:
+            continue
+        old = row_ids.get(row_id)
+        if old is None:
+            row_ids[row_id] = stable_id
+            changed = True
+            continue
+        while old in renamed and old != stable_id:  # 여러 번 수정된 경우 마지막 id부터 비교
+            old = renamed[old]
+        if old != stable_id and old not in by_stable and stable_id not in known:
+            # 옛 id는 사라지고 같은 자리에 처음 보는 id가 생김 → 행 내용이 수정된 것으로 보고 연결
+            renamed[old] = stable_id
+            known.add(stable_id)
+            changed = True
+    if changed:
+        _save_id_aliases(stable_col, aliases)
+    return {"row_id": by_row_id, "stable": by_stable, "aliases": aliases}
+
+def _resolve_stable_position(index: dict, stable_id: Optional[str]) -> Optional[int]:
+    """stable id의 현재 위치. 수정으로 바뀐 id면 renamed 기록을 따라갑니다."""
+    seen = set()
+    while stable_id and stable_id not in seen:
+        pos = index["stable"].get(stable_id)
+        if pos is not None:
+            return pos
+        seen.add(stable_id)
+        stable_id = index["aliases"]["renamed"].get(stable_id)
+    return None
+
 def find_row_by_identifier(df: pd.DataFrame, identifier: str, stable_col: str) -> pd.DataFrame:
+    """공유 링크 id로 행을 찾습니다. stable id → 과거 row_id 기록 → 현재 row_id 위치 순으로 찾습니다.
+    (예전 row_id 링크는 지금 그 자리에 있는 행이 아니라 row_id를 처음 발급할 때의 리포트로 연결)"""
     if identifier is None or df.empty:
         return df.iloc[0:0]
-    if "row_id" in df.columns:
-        row = df[df["row_id"] == identifier]
-        if not row.empty:
-            return row
-    if stable_col in df.columns:
-        row = df[df[stable_col] == identifier]
-        if not row.empty:
-            return row
-    return df.iloc[0:0]
+    if "row_id" not in df.columns or stable_col not in df.columns:
+        return df.iloc[0:0]
+    index = build_identifier_index(df, get_data_version(df), stable_col)
+    pos = _resolve_stable_position(index, identifier)
+    if pos is None:
+        historical = index["aliases"]["row_ids"].get(identifier)
+        # 기록이 있는 row_id는 기록된 리포트로만 연결 (삭제된 리포트 자리의 다른 행을 열지 않음)
+        pos = _resolve_stable_position(index, historical) if historical else index["row_id"].get(identifier)
+    if pos is None:
+        return df.iloc[0:0]
+    return df.iloc[[pos]]
 
 def build_share_url(view: str, item_key: str) -> str:
     return f"{APP_BASE_URL}/?view={view}&id={item_key}"
@@ -471,25 +638,20 @@ def render_detail_action_bar(back_href: str, back_label: str, share_url: str, ke
 # ─────────────────────────────────────────────────────────────
 # 데이터 로딩
 # ─────────────────────────────────────────────────────────────
-def build_csv_url(sheet_url: str) -> Optional[str]:
+def extract_sheet_id(sheet_url: str) -> Optional[str]:
     if not sheet_url or "docs.google.com" not in sheet_url:
         return None
     m = re.search(r"/spreadsheets/d/([^/]+)/", sheet_url)
-    if not m:
+    return m.group(1) if m else None
+
+def build_csv_url(sheet_url: str) -> Optional[str]:
+    sheet_id = extract_sheet_id(sheet_url)
+    if not sheet_id:
         return None
     gid = parse_qs(urlparse(sheet_url).query).get("gid", ["0"])[0]
-    return f"https://docs.google.com/spreadsheets/d/{m.group(1)}/export?format=csv&gid={gid}"
-
-@st.cache_data(ttl=300, show_spinner=False)
-def load_archive_df() -> pd.DataFrame:
-    csv = build_csv_url(ARCHIVE_SHEET_URL)
-    if not csv:
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(csv)
-    except Exception:
-        return pd.DataFrame()
+    return f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
 
+def _prepare_archive_df(df: pd.DataFrame) -> pd.DataFrame:
     col_map = {
         "IP": "ip", "IP명": "ip", "작품명": "ip",
         "프레젠테이션주소": "url", "프레젠테이션 주소": "url", "PPT주소": "url", "PPT 주소": "url",
@@ -521,45 +683,555 @@ def load_archive_df() -> pd.DataFrame:
     df = df[df["ip"] != ""].copy()
     df.reset_index(drop=True, inplace=True)
     df["row_id"] = df.index.astype(str)
-    df["actor_stable_id"] = df.apply(lambda r: make_stable_key("actor", r.get("ip", ""), r.get("cast_clean", "") or r.get("cast", ""), r.get("date", ""), r.get("air", "")), axis=1)
-    df["genre_stable_id"] = df.apply(lambda r: make_stable_key("genre", r.get("ip", ""), r.get("genre_title", ""), r.get("date", ""), r.get("air", "")), axis=1)
+    cast_key = df["cast_clean"].where(df["cast_clean"] != "", df["cast"])
+    df["actor_stable_id"] = make_stable_keys("actor", df["ip"], cast_key, df["date"], df["air"])
+    df["genre_stable_id"] = make_stable_keys("genre", df["ip"], df["genre_title"], df["date"], df["air"])
+    df.attrs["data_version"] = compute_data_version(df)
     return df
 
-@st.cache_data(ttl=300, show_spinner=False)
-def load_monthly_df() -> pd.DataFrame:
-    if not ARCHIVE_SHEET_URL:
+def _prepare_monthly_df(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.iloc[:, :3]
+    df.columns = ["title", "date", "url"]
+    
+    df = df.dropna(subset=["title", "url"])
+    for c in ["title", "date", "url"]:
+        df[c] = df[c].astype(str).fillna("").str.strip().replace("nan", "")
+        
+    df = df[df["title"] != ""].copy()
+    df.reset_index(drop=True, inplace=True)
+    df["row_id"] = "monthly_" + df.index.astype(str)
+    df["stable_id"] = make_stable_keys("monthly", df["title"], df["date"])
+    df.attrs["data_version"] = compute_data_version(df)
+    return df
+
+def _values_to_frame(values: List[list]) -> pd.DataFrame:
+    """Sheets API 표시 문자열 2차원 배열을 CSV 내보내기와 같은 방식으로 파싱합니다.
+    아카이브 탭은 기존 CSV 경로의 타입 추론을 그대로 거쳐 stable id가 달라지지 않게 합니다."""
+    if not values:
         return pd.DataFrame()
-    m = re.search(r"/spreadsheets/d/([^/]+)/", ARCHIVE_SHEET_URL)
-    if not m:
+    width = max(len(r) for r in values)
+    buf = io.StringIO()
+    csv.writer(buf).writerows(r + [""] * (width - len(r)) for r in values)
+    buf.seek(0)
+    return pd.read_csv(buf)
+
+def quote_sheet_title(title: str) -> str:
+    # A1 표기의 시트 이름은 작은따옴표로 감싸고, 이름 안의 작은따옴표는 두 번 씀
+    return "'" + title.replace("'", "''") + "'"
+
+def _trim_rows(rows: List[list]) -> List[list]:
+    """행 끝의 빈 셀과 마지막 빈 행들을 잘라냅니다. (values API / openpyxl 읽기와 같은 모양)"""
+    trimmed = []
+    for row in rows:
+        while row and row[-1] == "":
+            row = row[:-1]
+        trimmed.append(row)
+    while trimmed and not trimmed[-1]:
+        trimmed.pop()
+    return trimmed
+
+def _grid_cell_to_excel_value(cell: dict):
+    """Sheets API 셀(effectiveValue + 숫자 서식)을 xlsx 내보내기를 openpyxl → read_excel로 읽었을 때와 같은 값으로 변환합니다."""
+    value = cell.get("effectiveValue")
+    if not value:
+        return ""
+    if "stringValue" in value:
+        return value["stringValue"]
+    if "boolValue" in value:
+        return value["boolValue"]
+    if "errorValue" in value:
+        return float("nan")
+    number = value.get("numberValue", 0)
+    number_format = cell.get("effectiveFormat", {}).get("numberFormat", {})
+    pattern = number_format.get("pattern", "")
+    # openpyxl은 셀 서식이 날짜 형식이면 일련번호를 datetime(또는 time/timedelta)으로 바꿔 읽음
+    if number_format.get("type") in ("DATE", "TIME", "DATE_TIME") or (pattern and is_date_format(pattern)):
+        return from_excel(number, timedelta=bool(pattern) and is_timedelta_format(pattern))
+    # read_excel은 정수로 떨어지는 숫자를 int로 돌려줌
+    as_int = int(number)
+    return as_int if as_int == number else float(number)
+
+def _grid_to_excel_frame(grid: dict) -> pd.DataFrame:
+    """xlsx 경로(pd.read_excel)와 같은 셀 변환과 같은 파서(TextParser)로 DataFrame을 만듭니다."""
+    rows = _trim_rows([[_grid_cell_to_excel_value(cell) for cell in row.get("values", [])] for row in grid.get("rowData", [])])
+    if not rows:
         return pd.DataFrame()
-    
-    sheet_id = m.group(1)
+    width = max(len(r) for r in rows)
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    return TextParser(rows, header=0, skip_blank_lines=False).read()
+
+def _fetch_workbook_via_sheets_api(sheet_id: str) -> Optional[dict]:
+    """Sheets API로 아카이브 탭과 월간 탭을 가져옵니다. (시트 목록 조회 + values.batchGet + 월간 A:C 그리드 조회)
+
+    각 탭은 대체 경로와 같은 값이 나오도록 읽습니다. 아카이브 탭은 CSV 내보내기와 같은 표시 문자열(FORMATTED_VALUE)로,
+    월간 탭은 xlsx 내보내기(read_excel)와 같은 원시 값·날짜 변환으로 만들어 stable id와 공유 링크가
+    어느 경로로 불러와도 바뀌지 않게 합니다. 셀 서식이 필요한 월간 탭만 쓰는 열(A:C)에 한해 그리드로 받습니다."""
+    service = get_sheets_service()
+    if service is None:
+        return None
+    gid = int(parse_qs(urlparse(ARCHIVE_SHEET_URL).query).get("gid", ["0"])[0])
+    meta = call_google_api(
+        "sheets", lambda: service.spreadsheets().get(spreadsheetId=sheet_id, fields="sheets.properties(sheetId,title)").execute()
+    )
+    titles = {s["properties"]["sheetId"]: s["properties"]["title"] for s in meta.get("sheets", [])}
+    if gid not in titles or MONTHLY_SHEET_NAME not in titles.values():
+        logger.warning("Sheets API에서 아카이브(gid=%s) 또는 월간 탭을 찾지 못해 내보내기 URL로 불러옵니다.", gid)
+        return None
+    archive = call_google_api("sheets", lambda: service.spreadsheets().values().batchGet(
+        spreadsheetId=sheet_id,
+        ranges=[quote_sheet_title(titles[gid])],
+        valueRenderOption="FORMATTED_VALUE",
+    ).execute())
+    monthly = call_google_api("sheets", lambda: service.spreadsheets().get(
+        spreadsheetId=sheet_id,
+        ranges=[f"{quote_sheet_title(MONTHLY_SHEET_NAME)}!A:C"],
+        includeGridData=True,
+        fields="sheets.data.rowData.values(effectiveValue,effectiveFormat.numberFormat)",
+    ).execute())
+    archive_values = (archive.get("valueRanges") or [{}])[0].get("values", [])
+    monthly_grid = ((monthly.get("sheets") or [{}])[0].get("data") or [{}])[0]
+    return {
+        "archive": _prepare_archive_df(_values_to_frame(archive_values)),
+        "monthly": _prepare_monthly_df(_grid_to_excel_frame(monthly_grid)),
+    }
+
+def _fetch_workbook_via_export(sheet_id: str) -> dict:
     xlsx_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=xlsx"
-    
+    return {
+        "archive": _prepare_archive_df(pd.read_csv(build_csv_url(ARCHIVE_SHEET_URL))),
+        "monthly": _prepare_monthly_df(pd.read_excel(xlsx_url, sheet_name=MONTHLY_SHEET_NAME)),
+    }
+
+def _fetch_workbook() -> dict:
+    sheet_id = extract_sheet_id(ARCHIVE_SHEET_URL)
+    if not sheet_id:
+        return {"archive": pd.DataFrame(), "monthly": pd.DataFrame()}
     try:
-        df = pd.read_excel(xlsx_url, sheet_name="월간 드라마인사이트")
-        df = df.iloc[:, :3]
-        df.columns = ["title", "date", "url"]
-        
-        df = df.dropna(subset=["title", "url"])
-        for c in ["title", "date", "url"]:
-            df[c] = df[c].astype(str).fillna("").str.strip().replace("nan", "")
-            
-        df = df[df["title"] != ""].copy()
-        df.reset_index(drop=True, inplace=True)
-        df["row_id"] = "monthly_" + df.index.astype(str)
-        df["stable_id"] = df.apply(lambda r: make_stable_key("monthly", r.get("title", ""), r.get("date", "")), axis=1)
-        return df
+        workbook = _fetch_workbook_via_sheets_api(sheet_id)
+        if workbook is not None:
+            return workbook
+    except Exception:
+        # 서비스 계정에 시트 권한이 없는 경우 등 → 공개 내보내기 URL로 대체
+        logger.exception("Sheets API 시트 조회 실패, 내보내기 URL로 대체합니다.")
+    return _fetch_workbook_via_export(sheet_id)
+
+@st.cache_resource(show_spinner=False)
+def get_snapshot_store() -> dict:
+    """프로세스 전체가 공유하는 시트 스냅샷 보관소 (세션 간 공유, 재실행 간 유지)"""
+    return {"lock": threading.Lock(), "entries": {}, "load_locks": {}}
+
+def _snapshot_path(name: str) -> Path:
+    return CACHE_DIR / "snapshots" / f"{name}.json"
+
+def encode_snapshot(data: dict, version: str) -> str:
+    """{이름: DataFrame} 스냅샷을 JSON으로 직렬화합니다.
+    캐시 디렉터리는 공유 임시 폴더일 수 있으므로 역직렬화 시 코드가 실행될 수 있는 pickle은 쓰지 않습니다."""
+    frames = {
+        key: {
+            "table": df.to_json(orient="table", index=False),
+            # JSON 스키마로는 object / str dtype이 구분되지 않으므로 object 열을 따로 기록
+            "object_columns": [c for c in df.columns if df[c].dtype == object],
+            "attrs": dict(df.attrs),
+        }
+        for key, df in data.items()
+    }
+    return json.dumps({"version": version, "frames": frames}, ensure_ascii=False)
+
+def decode_snapshot(text: str) -> tuple:
+    saved = json.loads(text)
+    data = {}
+    for key, frame in saved["frames"].items():
+        df = pd.read_json(io.StringIO(frame["table"]), orient="table")
+        for c in frame["object_columns"]:
+            df[c] = df[c].astype(object)
+        df.attrs.update(frame["attrs"])
+        data[key] = df
+    return data, saved["version"]
+
+def _read_snapshot_from_disk(name: str) -> Optional[dict]:
+    path = _snapshot_path(name)
+    try:
+        data, version = decode_snapshot(path.read_text(encoding="utf-8"))
+        fetched_at = path.stat().st_mtime
+    except Exception:
+        return None
+    return {"data": data, "version": version, "next_refresh": fetched_at + SHEET_REFRESH_SECONDS, "refreshing": False}
+
+def _write_snapshot_to_disk(name: str, data: dict, version: str):
+    path = _snapshot_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(encode_snapshot(data, version), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def _refresh_snapshot(name: str, fetch, probe, entry: dict):
+    try:
+        # 변경 여부를 먼저 가벼운 메타데이터 요청으로 확인하고, 바뀌었을 때만 전체를 다시 내려받음
+        version = probe() if probe else ""
+        if version and version == entry["version"]:
+            _touch_snapshot(name)
+        else:
+            data = fetch()
+            _write_snapshot_to_disk(name, data, version)
+            entry["data"], entry["version"] = data, version
+    except Exception:
+        # 실패하면 마지막 정상 스냅샷을 계속 제공하고 잠시 뒤 재시도
+        entry["next_refresh"] = time.time() + SHEET_RETRY_SECONDS
+    else:
+        entry["next_refresh"] = time.time() + SHEET_REFRESH_SECONDS
+    finally:
+        entry["refreshing"] = False
+
+def _touch_snapshot(name: str):
+    try:
+        os.utime(_snapshot_path(name))  # 재시작 시에도 '방금 확인한 스냅샷'으로 취급되도록
+    except OSError:
+        pass
+
+def load_snapshot(name: str, fetch, probe=None):
+    """stale-while-revalidate: 보관 중인 스냅샷을 즉시 반환하고, 만료됐으면 백그라운드 스레드에서 갱신합니다.
+    메모리에 없으면 디스크의 마지막 정상 스냅샷을 쓰고, 그것도 없을 때만 동기로 불러옵니다. (실패 시 예외 전파)
+    probe는 원본의 버전 문자열을 돌려주는 가벼운 함수로, 버전이 같으면 다시 내려받지 않습니다."""
+    store = get_snapshot_store()
+    with store["lock"]:
+        entry = store["entries"].get(name)
+        load_lock = store["load_locks"].setdefault(name, threading.Lock())
+
+    if entry is None:
+        # 최초 로딩은 한 세션만 수행하고, 동시에 들어온 세션은 그 결과를 기다림
+        with load_lock:
+            entry = store["entries"].get(name)
+            if entry is None:
+                entry = _read_snapshot_from_disk(name)
+                if entry is None:
+                    version = probe() if probe else ""
+                    data = fetch()
+                    _write_snapshot_to_disk(name, data, version)
+                    entry = {"data": data, "version": version, "next_refresh": time.time() + SHEET_REFRESH_SECONDS, "refreshing": False}
+                store["entries"][name] = entry
+
+    with store["lock"]:
+        start_refresh = time.time() >= entry["next_refresh"] and not entry["refreshing"]
+        if start_refresh:
+            entry["refreshing"] = True
+    if start_refresh:
+        threading.Thread(target=_refresh_snapshot, args=(name, fetch, probe, entry), daemon=True).start()
+    return entry["data"]
+
+def _probe_archive_sheet_version() -> str:
+    sheet_id = extract_sheet_id(ARCHIVE_SHEET_URL)
+    return get_drive_file_version(sheet_id) if sheet_id else ""
+
+def load_workbook() -> dict:
+    """아카이브 탭과 월간 탭은 같은 스프레드시트이므로 한 번에 받아 하나의 스냅샷으로 관리합니다."""
+    return load_snapshot("workbook", _fetch_workbook, _probe_archive_sheet_version)
+
+def load_archive_df() -> pd.DataFrame:
+    try:
+        return load_workbook()["archive"]
+    except Exception:
+        return pd.DataFrame()
+
+def load_monthly_df() -> pd.DataFrame:
+    try:
+        return load_workbook()["monthly"]
     except Exception as e:
         st.error(f"월간 드라마인사이트 시트 로딩 실패: {e}\n(openpyxl 패키지가 설치되어 있는지 확인하세요.)")
         return pd.DataFrame()
 
 
+# ─────────────────────────────────────────────────────────────
+# 디스크 캐시 – 프로세스 재시작 후에도 유지되는 렌더링 결과
+# ─────────────────────────────────────────────────────────────
+def _disk_cache_path(namespace: str, key: tuple, ext: str) -> Path:
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.{ext}"
+
+def disk_cache_get(namespace: str, key: tuple, ext: str) -> Optional[bytes]:
+    path = _disk_cache_path(namespace, key, ext)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(path)  # LRU 순서 갱신 (mtime = 마지막 사용 시각)
+    except OSError:
+        pass
+    return data
+
+def disk_cache_put(namespace: str, key: tuple, ext: str, data: bytes, max_bytes: int) -> int:
+    """저장 후 용량 상한에 맞춰 정리하고, 정리된(삭제된) 파일 수를 반환합니다."""
+    path = _disk_cache_path(namespace, key, ext)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 다른 세션이 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        return 0
+    return maybe_evict_disk_cache(path.parent, max_bytes, len(data), keep=path)
+
+@st.cache_resource(show_spinner=False)
+def get_disk_cache_usage() -> dict:
+    """프로세스 전체의 디렉터리별 용량 추정 {디렉터리: {"bytes": 마지막 정리 후 용량 + 이후 기록량, "scanned": 정리 시각}}"""
+    return {"lock": threading.Lock(), "dirs": {}}
+
+def maybe_evict_disk_cache(directory: Path, max_bytes: int, written: int, keep: Optional[Path] = None) -> int:
+    """방금 written 바이트를 기록했음을 반영하고, 추정 용량이 상한을 넘거나 마지막 정리 후
+    DISK_CACHE_RESCAN_SECONDS가 지났을 때만 evict_disk_cache로 디렉터리를 다시 훑습니다.
+    (다른 프로세스·다운로드 조각처럼 추정에 잡히지 않는 기록은 주기적인 재검사에서 반영)"""
+    usage = get_disk_cache_usage()
+    key = str(directory)
+    now = time.monotonic()
+    with usage["lock"]:
+        state = usage["dirs"].get(key)
+        if state is not None and state["bytes"] + written <= max_bytes and now - state["scanned"] < DISK_CACHE_RESCAN_SECONDS:
+            state["bytes"] += written
+            return 0
+    evicted, total = _evict_disk_cache(directory, max_bytes, keep)
+    with usage["lock"]:
+        usage["dirs"][key] = {"bytes": total, "scanned": now}
+    return evicted
+
+def evict_disk_cache(directory: Path, max_bytes: int, keep: Optional[Path] = None) -> int:
+    """디렉터리 총 용량이 max_bytes를 넘으면 가장 오래 사용되지 않은 파일부터 삭제하고 삭제한 파일 수를 반환합니다.
+    keep은 방금 저장한 파일로, 혼자서 상한을 넘더라도 이번 요청에서 쓸 수 있도록 남겨둡니다.
+
+    쓰는 중인 임시 파일(*.tmp, 다운로드 조각 *.part.tmp)도 용량에 포함합니다. 그중 DISK_CACHE_STALE_TMP_SECONDS
+    동안 기록이 없는 파일은 중단된 다운로드·쓰기의 잔여물로 보고 다른 파일과 함께 정리 대상에 넣습니다."""
+    return _evict_disk_cache(directory, max_bytes, keep)[0]
+
+def _evict_disk_cache(directory: Path, max_bytes: int, keep: Optional[Path]) -> tuple:
+    # (삭제한 파일 수, 정리 후 총 용량)
+    entries = []
+    total = 0
+    stale_before = time.time() - DISK_CACHE_STALE_TMP_SECONDS
+    for entry in os.scandir(directory):
+        if not entry.is_file():
+            continue
+        try:
+            info = entry.stat()
+        except OSError:
+            continue  # 다른 세션이 방금 교체·삭제한 파일
+        total += info.st_size
+        if entry.name.endswith(".tmp") and info.st_mtime > stale_before:
+            continue
+        entries.append((info.st_mtime, info.st_size, entry.path))
+    evicted = 0
+    if total <= max_bytes:
+        return evicted, total
+    for _, size, p in sorted(entries):
+        if keep is not None and p == str(keep):
+            continue
+        try:
+            os.remove(p)
+        except OSError:
+            continue
+        evicted += 1
+        total -= size
+        if total <= max_bytes:
+            break
+    return evicted, total
+
+
+def publish_static_asset(data: bytes, ext: str) -> str:
+    """내용 해시를 파일명으로 static/assets에 저장하고 파일명을 반환합니다.
+    같은 내용은 항상 같은 URL이 되므로 브라우저가 방문 간에도 그대로 재사용합니다."""
+    name = f"{hashlib.sha256(data).hexdigest()[:32]}.{ext}"
+    if touch_static_asset(name):
+        return name
+    path = STATIC_ASSET_DIR / name
+    try:
+        STATIC_ASSET_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        return name
+    maybe_evict_disk_cache(STATIC_ASSET_DIR, PAGE_CACHE_MAX_BYTES, len(data), keep=path)
+    return name
+
+def touch_static_asset(name: str) -> bool:
+    try:
+        os.utime(STATIC_ASSET_DIR / name)
+        return True
+    except OSError:
+        return False
+
+def static_asset_url(name: str) -> str:
+    return f"{STATIC_URL_PREFIX}/assets/{name}"
+
+
+# ─────────────────────────────────────────────────────────────
+# 요청 병합(single-flight) – 같은 원본을 여러 세션이 동시에 요청해도 한 번만 호출
+# ─────────────────────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def get_inflight_store() -> dict:
+    """프로세스 전체의 진행 중 호출 {key: 호출 상태}와 진행 중 페이지 렌더링 {key: Future}"""
+    return {"lock": threading.Lock(), "calls": {}, "renders": {}}
+
+def single_flight(key: tuple, fn):
+    """같은 key의 호출이 이미 진행 중이면 새로 호출하지 않고 그 결과(또는 예외)를 기다려 함께 사용합니다.
+
+    st.cache_data는 함수별 캐시 키 단위로만 중복 계산을 막으므로, 캐시 밖의 경로(디스크 캐시, 썸네일 프록시)나
+    캐시 만료 직후의 동시 요청까지 원본 호출을 키당 한 번으로 묶는 데 사용합니다."""
+    store = get_inflight_store()
+    with store["lock"]:
+        call = store["calls"].get(key)
+        leader = call is None
+        if leader:
+            call = store["calls"][key] = {"done": threading.Event(), "result": None, "error": None}
+    if not leader:
+        call["done"].wait()
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+    try:
+        call["result"] = fn()
+    except Exception as e:
+        call["error"] = e
+        raise
+    finally:
+        with store["lock"]:
+            store["calls"].pop(key, None)
+        call["done"].set()
+    return call["result"]
+
+def shared_future(key: tuple, submit):
+    """같은 key의 작업이 진행 중이면 그 Future를, 아니면 submit()으로 새 Future를 만들어 반환합니다."""
+    store = get_inflight_store()
+    with store["lock"]:
+        future = store["renders"].get(key)
+        if future is None:
+            future = store["renders"][key] = submit()
+            future.add_done_callback(lambda _: store["renders"].pop(key, None))
+    return future
+
+
+# ─────────────────────────────────────────────────────────────
+# Google API 호출 – 토큰 버킷 호출량 제한 + 지수 백오프(지터) 재시도
+# ─────────────────────────────────────────────────────────────
+# 버킷별 (초당 호출 수, 순간 최대 호출 수). 서비스 계정 한 개(=사용자 1명) 기준 쿼터에 맞춘 기본값:
+# Slides 읽기 분당 600 / getThumbnail(고비용 읽기) 분당 60 / Sheets 읽기 분당 60 / Drive 분당 12,000
+def read_qps_setting(name: str, default: float) -> float:
+    """Secrets의 초당 호출 수. 0 이하·숫자가 아닌 값이면 토큰이 영원히 차지 않으므로 기본값을 사용합니다."""
+    try:
+        rate = float(st.secrets.get(name, default))
+    except (TypeError, ValueError):
+        rate = 0.0
+    if not rate > 0:  # NaN 포함
+        logger.warning("%s 값이 올바르지 않아 기본값 %s를 사용합니다.", name, default)
+        return float(default)
+    return rate
+
+GOOGLE_API_RATE_LIMITS = {
+    "slides": (read_qps_setting("SLIDES_QPS", 8), 10),
+    "slides_thumbnail": (read_qps_setting("SLIDES_THUMBNAIL_QPS", 1), 4),
+    "sheets": (read_qps_setting("SHEETS_QPS", 1), 5),
+    "drive": (read_qps_setting("DRIVE_QPS", 100), 200),
+}
+GOOGLE_API_MAX_RETRIES = 5
+GOOGLE_API_BACKOFF_BASE = 0.5  # 초
+GOOGLE_API_BACKOFF_MAX = 30
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+class IncompleteResult(Exception):
+    """일부 호출이 재시도 후에도 실패한 결과. st.cache_data는 예외를 캐시하지 않으므로
+    캐시 함수 안에서 이 예외로 부분 결과를 올려보내고, 호출 측 래퍼가 이번 렌더링에만 사용합니다."""
+
+    def __init__(self, value):
+        super().__init__("incomplete result")
+        self.value = value
+
+@st.cache_resource(show_spinner=False)
+def get_rate_limiters() -> dict:
+    now = time.monotonic()
+    return {
+        name: {"lock": threading.Lock(), "rate": rate, "capacity": burst, "tokens": float(burst), "updated": now}
+        for name, (rate, burst) in GOOGLE_API_RATE_LIMITS.items()
+    }
+
+def acquire_api_token(bucket: str, limiters: Optional[dict] = None):
+    """버킷에 토큰이 생길 때까지 기다렸다가 하나 가져갑니다. (프로세스 전체 세션·스레드 공용)
+    스크립트 실행 밖의 스레드는 스크립트에서 받아 둔 get_rate_limiters() 결과를 limiters로 넘깁니다."""
+    limiter = (limiters or get_rate_limiters())[bucket]
+    while True:
+        with limiter["lock"]:
+            now = time.monotonic()
+            limiter["tokens"] = min(limiter["capacity"], limiter["tokens"] + (now - limiter["updated"]) * limiter["rate"])
+            limiter["updated"] = now
+            if limiter["tokens"] >= 1:
+                limiter["tokens"] -= 1
+                return
+            wait = (1 - limiter["tokens"]) / limiter["rate"]
+        time.sleep(wait)
+
+def backoff_delay(attempt: int) -> float:
+    # full jitter: 동시에 실패한 요청들이 같은 시점에 다시 몰리지 않도록 0 ~ 상한 사이에서 무작위로 대기
+    return random.uniform(0, min(GOOGLE_API_BACKOFF_MAX, GOOGLE_API_BACKOFF_BASE * (2 ** attempt)))
+
+def is_retryable_error(e: Exception) -> bool:
+    if isinstance(e, HttpError):
+        if e.resp.status in _RETRYABLE_STATUS:
+            return True
+        # Drive는 호출량 초과를 403 + errors[].reason으로 알려줌
+        if e.resp.status != 403:
+            return False
+        try:
+            errors = json.loads(e.content).get("error", {}).get("errors", [])
+        except (ValueError, AttributeError):
+            return False
+        return any(err.get("reason") in _RATE_LIMIT_REASONS for err in errors if isinstance(err, dict))
+    return isinstance(e, (httplib2.HttpLib2Error, OSError))
+
+def call_google_api(bucket: str, fn, cost: int = 1, limiters: Optional[dict] = None):
+    """모든 Google API 호출이 거치는 공용 실행기.
+    버킷별 토큰 버킷으로 호출량을 맞추고, 일시 오류(429/5xx/네트워크)는 지수 백오프로 재시도합니다.
+    재시도 후에도 실패하면 예외를 그대로 올려, 실패 결과가 정상 값처럼 캐시되지 않도록 합니다.
+    cost는 batch 요청처럼 한 번에 여러 호출이 쿼터에 잡히는 경우의 호출 수입니다."""
+    for attempt in range(GOOGLE_API_MAX_RETRIES + 1):
+        for _ in range(cost):
+            acquire_api_token(bucket, limiters)
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == GOOGLE_API_MAX_RETRIES or not is_retryable_error(e):
+                raise
+        time.sleep(backoff_delay(attempt))
+
+
 # ─────────────────────────────────────────────────────────────
 # Google API – Slides / Drive 인증 및 썸네일
 # ─────────────────────────────────────────────────────────────
 SLIDES_SCOPES = ["https://www.googleapis.com/auth/presentations.readonly"]
+SLIDES_THUMBNAIL_CONCURRENCY = int(st.secrets.get("SLIDES_THUMBNAIL_CONCURRENCY", 4))
+# 배우/장르 상세 슬라이드 렌더링 방식: "thumbnail"(페이지별 getThumbnail) / "pdf"(Drive PDF 내보내기 후 로컬 래스터화)
+SLIDE_RENDER_MODE = st.secrets.get("SLIDE_RENDER_MODE", "thumbnail")
 DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
+SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+
+# PDF 뷰어: 한 번에 렌더링할 페이지 수 / 래스터화 워커 프로세스 수
+PDF_PAGE_BATCH = 3
+PDF_RENDER_WORKERS = int(st.secrets.get("PDF_RENDER_WORKERS", 0)) or min(4, os.cpu_count() or 1)
+
+# PDF 페이지 인코딩 티어 (이름, 배율, 포맷, 품질) – 포맷은 png / jpeg / webp
+# preview는 먼저 뜨는 저해상도 미리보기, 나머지는 srcset으로 기기 해상도에 맞춰 브라우저가 선택
+PDF_IMAGE_FORMAT = st.secrets.get("PDF_IMAGE_FORMAT", "webp")
+PDF_IMAGE_QUALITY = int(st.secrets.get("PDF_IMAGE_QUALITY", 80))
+PDF_PAGE_TIERS = (
+    ("preview", 0.3, "jpeg", 40),
+    ("1x", 1.0, PDF_IMAGE_FORMAT, PDF_IMAGE_QUALITY),
+    ("2x", 2.0, PDF_IMAGE_FORMAT, PDF_IMAGE_QUALITY),
+)
+# 다운로드 중 첫 페이지 임시 미리보기 (정적 에셋으로 저장하지 않고 인라인으로 한 장만 표시)
+PDF_PREVIEW_TIERS = (("1x", 1.0, PDF_IMAGE_FORMAT, PDF_IMAGE_QUALITY),)
+# 첫 페이지 구간이 도착했을 때 미리보기 렌더링을 기다리는 최대 시간 (그동안 다운로드는 잠시 멈춤)
+PDF_PREVIEW_WAIT_SECONDS = 1.5
 
 @st.cache_resource(show_spinner=False)
 def get_google_credentials(scopes: List[str]):
@@ -580,66 +1252,531 @@ def get_slides_service():
     if not creds: return None
     return build("slides", "v1", credentials=creds, cache_discovery=False)
 
+@st.cache_resource(show_spinner=False)
+def get_sheets_service():
+    creds = get_google_credentials(SHEETS_SCOPES)
+    if not creds: return None
+    return build("sheets", "v4", credentials=creds, cache_discovery=False)
+
 @st.cache_resource(show_spinner=False)
 def get_drive_service():
     creds = get_google_credentials(DRIVE_SCOPES)
     if not creds: return None
     return build("drive", "v3", credentials=creds, cache_discovery=False)
 
-@st.cache_data(ttl=600, show_spinner=False)
-def get_presentation_page_ids(presentation_id: str) -> List[str]:
+def get_drive_file_version(file_id: str) -> str:
+    """파일이 수정될 때마다 바뀌는 버전 문자열 (캐시하지 않는 가벼운 메타데이터 요청, 실패 시 빈 문자열)"""
+    service = get_drive_service()
+    if service is None: return ""
+    try:
+        meta = call_google_api("drive", lambda: service.files().get(fileId=file_id, fields="modifiedTime,version").execute())
+        return f'{meta.get("version", "")}:{meta.get("modifiedTime", "")}'
+    except Exception as e:
+        return ""
+
+def _load_presentation_page_ids(presentation_id: str, revision: str) -> List[str]:
     service = get_slides_service()
     if service is None: return []
+    pres = single_flight(
+        ("slide_page_ids", presentation_id, revision),
+        lambda: call_google_api(
+            "slides", lambda: service.presentations().get(presentationId=presentation_id, fields="slides.objectId").execute()
+        ),
+    )
+    slides = pres.get("slides", [])
+    return [s.get("objectId") for s in slides if s.get("objectId")]
+
+@st.cache_data(ttl=3600, max_entries=200, show_spinner=False)
+def _fetch_presentation_page_ids(presentation_id: str, revision: str) -> List[str]:
+    return _load_presentation_page_ids(presentation_id, revision)
+
+# 리비전을 모르는 덱(메타데이터 조회 실패 등)은 수정돼도 캐시 키가 바뀌지 않으므로 짧게만 재사용
+SLIDES_UNVERSIONED_TTL_SECONDS = 60
+
+@st.cache_data(ttl=SLIDES_UNVERSIONED_TTL_SECONDS, max_entries=200, show_spinner=False)
+def _fetch_unversioned_presentation_page_ids(presentation_id: str) -> List[str]:
+    return _load_presentation_page_ids(presentation_id, "")
+
+def get_presentation_page_ids(presentation_id: str, revision: str = "") -> List[str]:
+    """슬라이드 objectId 목록만 필드 마스크로 받아옵니다. (전체 도형/텍스트 JSON은 받지 않음)
+    revision(Drive 리비전)이 캐시 키에 포함되어 덱이 수정되면 자동으로 다시 조회합니다.
+    리비전을 모르면 SLIDES_UNVERSIONED_TTL_SECONDS 동안만 캐시합니다. 실패는 캐시하지 않습니다."""
     try:
-        pres = service.presentations().get(presentationId=presentation_id).execute()
-        slides = pres.get("slides", [])
-        return [s.get("objectId") for s in slides if s.get("objectId")]
+        if not revision:
+            return _fetch_unversioned_presentation_page_ids(presentation_id)
+        return _fetch_presentation_page_ids(presentation_id, revision)
     except Exception as e:
         return []
 
-@st.cache_data(ttl=600, show_spinner=False)
-def get_slide_thumbnail_url(presentation_id: str, page_object_id: str) -> Optional[str]:
-    service = get_slides_service()
-    if service is None: return None
+_thread_local = threading.local()
+
+@st.cache_resource(show_spinner=False)
+def get_slides_thumbnail_pool() -> ThreadPoolExecutor:
+    # 스레드를 유지해 스레드별 service / http 객체(httplib2는 스레드 간 공유 불가)를 재사용
+    # 슬라이드 getThumbnail과 썸네일 프록시의 이미지 다운로드가 함께 사용합니다.
+    return ThreadPoolExecutor(max_workers=SLIDES_THUMBNAIL_CONCURRENCY, thread_name_prefix="slides-thumb")
+
+def _thread_slides_service(creds):
+    service = getattr(_thread_local, "slides_service", None)
+    if service is None:
+        service = build("slides", "v1", credentials=creds, cache_discovery=False)
+        _thread_local.slides_service = service
+    return service
+
+def _fetch_slide_thumbnail(creds, presentation_id: str, page_object_id: str) -> Optional[str]:
     try:
-        resp = service.presentations().pages().getThumbnail(
+        resp = call_google_api("slides_thumbnail", lambda: _thread_slides_service(creds).presentations().pages().getThumbnail(
             presentationId=presentation_id,
             pageObjectId=page_object_id,
             thumbnailProperties_thumbnailSize="LARGE",
-        ).execute()
+        ).execute())
         return resp.get("contentUrl")
     except Exception as e:
         return None
 
+# 썸네일 프록시: 원본 이미지를 한 번만 받아 아래 너비로 축소한 뒤 정적 파일(내용 해시 파일명)로 제공
+THUMBNAIL_CARD_WIDTH = 640
+THUMBNAIL_SLIDE_WIDTH = 1200
+
+@st.cache_resource(show_spinner=False)
+def get_thumbnail_proxy_map() -> dict:
+    """원본 키 → 정적 파일명 (디스크 thumb_map에도 보관해 재시작 후에도 재사용)"""
+    return {}
+
+def lookup_proxied_thumbnail(source_key: tuple) -> Optional[str]:
+    names = get_thumbnail_proxy_map()
+    name = names.get(source_key)
+    if name is None:
+        data = disk_cache_get("thumb_map", source_key, "txt")
+        name = data.decode("ascii") if data else None
+    # 정적 파일이 용량 제한으로 정리됐으면 다시 받아야 하므로 매핑도 버림
+    if name and touch_static_asset(name):
+        names[source_key] = name
+        return static_asset_url(name)
+    names.pop(source_key, None)
+    return None
+
+def resize_thumbnail(data: bytes, width: int) -> bytes:
+    img = Image.open(io.BytesIO(data)).convert("RGB")
+    if img.width > width:
+        img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format=PDF_IMAGE_FORMAT.upper(), quality=PDF_IMAGE_QUALITY)
+    return buf.getvalue()
+
+def _thread_authorized_http(creds):
+    # 썸네일 프록시 이미지와 PDF 스트리밍 다운로드가 함께 사용 (httplib2는 스레드 간 공유 불가)
+    http = getattr(_thread_local, "authorized_http", None)
+    if http is None:
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+        _thread_local.authorized_http = http
+    return http
+
+def proxy_thumbnail(creds, source_key: tuple, url: str, width: int) -> Optional[str]:
+    """원본 이미지를 받아 축소·재인코딩해 static/assets에 저장하고 정적 URL을 반환합니다. 실패 시 None."""
+    cached = lookup_proxied_thumbnail(source_key)
+    if cached:
+        return cached
+    try:
+        return single_flight(("thumb",) + source_key, lambda: _proxy_thumbnail_fetch(creds, source_key, url, width))
+    except Exception as e:
+        return None
+
+def _proxy_thumbnail_fetch(creds, source_key: tuple, url: str, width: int) -> Optional[str]:
+    # 먼저 도착한 요청이 받아둔 경우 (대기하던 요청이 다음 차례로 들어온 경우 포함)
+    cached = lookup_proxied_thumbnail(source_key)
+    if cached:
+        return cached
+    resp, content = _thread_authorized_http(creds).request(url)
+    if resp.status != 200:
+        return None
+    name = publish_static_asset(resize_thumbnail(content, width), PDF_IMAGE_FORMAT)
+    disk_cache_put("thumb_map", source_key, "txt", name.encode("ascii"), PAGE_CACHE_MAX_BYTES)
+    get_thumbnail_proxy_map()[source_key] = name
+    return static_asset_url(name)
+
+def _slide_source_key(presentation_id: str, revision: str, page_object_id: str) -> tuple:
+    return ("slide", presentation_id, revision, page_object_id, THUMBNAIL_SLIDE_WIDTH)
+
+def _fetch_slide_image(creds, drive_creds, presentation_id: str, revision: str, page_object_id: str) -> Optional[str]:
+    # 같은 리비전의 슬라이드는 이미 받아둔 이미지를 쓰고 getThumbnail 호출 자체를 건너뜀
+    source_key = _slide_source_key(presentation_id, revision, page_object_id)
+    cached = lookup_proxied_thumbnail(source_key)
+    if cached:
+        return cached
+    content_url = single_flight(
+        ("slide_thumb", presentation_id, page_object_id),
+        lambda: _fetch_slide_thumbnail(creds, presentation_id, page_object_id),
+    )
+    if not content_url or not revision:
+        return content_url  # 리비전을 모르면 다른 버전의 이미지와 구분할 수 없으므로 프록시·기록하지 않음
+    # 프록시는 기다리지 않고 백그라운드에서 채움 → 이번 렌더링은 contentUrl, 다음 렌더링부터 정적 URL
+    pool = get_slides_thumbnail_pool()
+    shared_future(
+        ("thumb_proxy",) + source_key,
+        lambda: pool.submit(proxy_thumbnail, drive_creds, source_key, content_url, THUMBNAIL_SLIDE_WIDTH),
+    )
+    return content_url
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_slide_thumbnail_urls(presentation_id: str, revision: str, page_object_ids: tuple) -> List[Optional[str]]:
+    creds = get_google_credentials(SLIDES_SCOPES)
+    if not creds: return [None] * len(page_object_ids)
+    drive_creds = get_google_credentials(DRIVE_SCOPES) or creds
+    pool = get_slides_thumbnail_pool()
+    urls = list(pool.map(lambda obj_id: _fetch_slide_image(creds, drive_creds, presentation_id, revision, obj_id), page_object_ids))
+    if None in urls:
+        raise IncompleteResult(urls)
+    return urls
+
+def get_slide_thumbnail_urls(presentation_id: str, revision: str, page_object_ids: tuple) -> List[Optional[str]]:
+    """여러 슬라이드의 썸네일을 병렬로 요청하고, 입력 순서 그대로 이미지 URL 목록을 반환합니다.
+    동시 요청 수는 SLIDES_THUMBNAIL_CONCURRENCY로 제한합니다. (getThumbnail은 고비용 읽기 쿼터 대상)
+    프록시가 끝나기 전에는 contentUrl을 바로 쓰고, 프록시된 슬라이드는 캐시된 목록 위에 정적 URL로 덮어씁니다.
+    일부가 실패하면 이번 렌더링에만 부분 결과를 쓰고 캐시하지 않습니다. (받아둔 슬라이드는 프록시에서 재사용)"""
+    try:
+        urls = _fetch_slide_thumbnail_urls(presentation_id, revision, page_object_ids)
+    except IncompleteResult as e:
+        urls = e.value
+    if not revision:
+        return urls
+    return [
+        (lookup_proxied_thumbnail(_slide_source_key(presentation_id, revision, obj_id)) or url) if url else url
+        for obj_id, url in zip(page_object_ids, urls)
+    ]
+
+DRIVE_BATCH_LIMIT = 100  # Drive batch 요청 1회당 최대 호출 수
+
+def _fetch_drive_thumbnail_chunk(service, chunk: tuple) -> dict:
+    """batch 한 번의 결과. 일부 항목이 일시 오류로 실패하면 그 항목만 다시 batch로 요청합니다.
+    재시도할 수 없는 오류로 실패한 항목이 있으면 '썸네일 없음'으로 캐시되지 않도록 IncompleteResult를 올립니다."""
+    links = {}
+    failed = []
+    pending = list(chunk)
+    for attempt in range(GOOGLE_API_MAX_RETRIES + 1):
+        retry = []
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                (retry if is_retryable_error(exception) else failed).append(request_id)
+                return
+            link = (response or {}).get("thumbnailLink")
+            if link:
+                links[request_id] = (re.sub(r'=s\d+$', '=s1000', link), response.get("modifiedTime", ""))
+
+        batch = service.new_batch_http_request(callback=_collect)
+        for file_id in pending:
+            batch.add(service.files().get(fileId=file_id, fields="id,thumbnailLink,modifiedTime"), request_id=file_id)
+        call_google_api("drive", batch.execute, cost=len(pending))
+        if not retry:
+            if failed:
+                raise IncompleteResult(links)
+            return links
+        pending = retry
+        time.sleep(backoff_delay(attempt))
+    raise IncompleteResult(links)
+
 @st.cache_data(ttl=600, show_spinner=False)
-def get_drive_thumbnail_url(file_id: str) -> Optional[str]:
+def _fetch_drive_thumbnail_links(file_ids: tuple) -> dict:
     service = get_drive_service()
-    if service is None: return None
+    if service is None or not file_ids: return {}
+    unique_ids = list(dict.fromkeys(file_ids))
+    links = {}
+    failed = False
+    for i in range(0, len(unique_ids), DRIVE_BATCH_LIMIT):
+        chunk = tuple(unique_ids[i:i + DRIVE_BATCH_LIMIT])
+        try:
+            links.update(single_flight(("drive_thumb_links", chunk), lambda: _fetch_drive_thumbnail_chunk(service, chunk)))
+        except IncompleteResult as e:
+            links.update(e.value)
+            failed = True
+        except Exception as e:
+            failed = True
+    if failed:
+        raise IncompleteResult(links)
+    return links
+
+def get_drive_thumbnail_links(file_ids: tuple) -> dict:
+    """여러 파일의 (썸네일 링크, 수정 시각)을 Drive batch 요청으로 한꺼번에 가져옵니다. (카드 수와 무관하게 왕복 1회)
+    일부가 실패하면 이번 렌더링에만 부분 결과를 쓰고 캐시하지 않습니다."""
     try:
-        file_meta = service.files().get(fileId=file_id, fields="thumbnailLink").execute()
-        link = file_meta.get("thumbnailLink")
-        if link:
-            link = re.sub(r'=s\d+$', '=s1000', link)
-        return link
-    except Exception as e:
+        return _fetch_drive_thumbnail_links(file_ids)
+    except IncompleteResult as e:
+        return e.value
+
+def get_drive_thumbnail_urls(file_ids: tuple) -> dict:
+    """카드용 썸네일 URL. 파일 수정 시각별로 한 번만 받아 카드 크기로 줄인 정적 파일을 가리킵니다.
+    아직 프록시되지 않은 썸네일은 기다리지 않고 Drive 썸네일 링크를 바로 쓰고, 프록시는 백그라운드에서 채워
+    다음 렌더링부터 정적 URL을 사용합니다. 수정 시각을 모르면 버전을 구분할 수 없으므로 프록시하지 않습니다."""
+    links = get_drive_thumbnail_links(file_ids)
+    creds = get_google_credentials(DRIVE_SCOPES)
+    if not links or not creds: return {}
+    pool = get_slides_thumbnail_pool()
+    urls = {}
+    for file_id, (link, modified) in links.items():
+        urls[file_id] = link
+        if not modified:
+            continue
+        source_key = ("drive", file_id, modified, THUMBNAIL_CARD_WIDTH)
+        cached = lookup_proxied_thumbnail(source_key)
+        if cached:
+            urls[file_id] = cached
+            continue
+        shared_future(
+            ("thumb_proxy",) + source_key,
+            lambda key=source_key, url=link: pool.submit(proxy_thumbnail, creds, key, url, THUMBNAIL_CARD_WIDTH),
+        )
+    return urls
+
+# PDF 다운로드: Range 요청 한 번에 받을 크기 / 일시 오류 시 같은 위치부터 다시 시도하는 횟수
+DRIVE_DOWNLOAD_CHUNK_BYTES = int(st.secrets.get("DRIVE_DOWNLOAD_CHUNK_MB", 8)) * 1024 * 1024
+# 첫 요청은 작게 받아 진행률과 첫 페이지 미리보기(선형화 PDF)가 빨리 뜨도록 함
+DRIVE_DOWNLOAD_FIRST_CHUNK_BYTES = 1024 * 1024
+DRIVE_DOWNLOAD_RETRIES = GOOGLE_API_MAX_RETRIES
+
+def _content_range_total(header: Optional[str]) -> Optional[int]:
+    # "bytes 0-8388607/12345678" 또는 "bytes */12345678"
+    if not header or header.endswith("/*"):
         return None
+    return int(header.rsplit("/", 1)[1])
+
+def stream_download(http, uri: str, dest: Path, progress=None, resume: bool = True, limiters: Optional[dict] = None) -> int:
+    """uri를 Range 요청으로 나눠 받아 dest에 바로 기록하고 총 바이트 수를 반환합니다.
+
+    청크는 받는 즉시 디스크에 쓰므로 메모리에는 청크 하나만 머뭅니다. 받는 중에는 dest.part.tmp에 쓰고,
+    일시 오류(네트워크, 429/5xx)가 나면 잠시 쉬었다가 이미 받은 위치부터 이어받습니다.
+    resume=True면 이전 시도에서 남은 조각 파일도 이어서 사용합니다.
+    progress(받은 바이트, 전체 바이트|None, 조각 파일 경로)는 청크를 기록할 때마다 호출되며,
+    True를 반환하면 다음 청크도 첫 청크 크기로 작게 받습니다. (첫 페이지 미리보기를 기다리는 동안)"""
+    partial = dest.with_name(f"{dest.name}.part.tmp")
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if not resume:
+        partial.unlink(missing_ok=True)
+    offset = partial.stat().st_size if partial.exists() else 0
+    total = None
+    failures = 0
+    small_chunks = True
+    with open(partial, "ab") as fh:
+        while total is None or offset < total:
+            chunk_bytes = DRIVE_DOWNLOAD_FIRST_CHUNK_BYTES if offset == 0 or small_chunks else DRIVE_DOWNLOAD_CHUNK_BYTES
+            headers = {"range": f"bytes={offset}-{offset + chunk_bytes - 1}"}
+            acquire_api_token("drive", limiters)
+            try:
+                resp, content = http.request(uri, headers=headers)
+                status = resp.status
+            except (httplib2.HttpLib2Error, OSError) as e:
+                status, content = None, e
+            if status is None or status in _RETRYABLE_STATUS:
+                failures += 1
+                if failures > DRIVE_DOWNLOAD_RETRIES:
+                    raise RuntimeError(f"다운로드 재시도 한도 초과 ({offset} bytes에서 중단): {content if status is None else status}")
+                time.sleep(backoff_delay(failures))
+                continue
+            failures = 0
+            if status == 416 and offset and _content_range_total(resp.get("content-range")) == offset:
+                break  # 조각 파일이 이미 완성본인 경우
+            if status == 200:
+                # Range를 지원하지 않는 응답(내보내기 등)은 전체 본문이 한 번에 옴
+                fh.seek(0)
+                fh.truncate()
+                fh.write(content)
+                offset = total = len(content)
+                break
+            if status != 206:
+                raise RuntimeError(f"다운로드 실패: HTTP {status}")
+            fh.write(content)
+            fh.flush()  # 진행 중에도 다른 프로세스가 받은 부분까지 읽을 수 있도록
+            offset += len(content)
+            total = _content_range_total(resp.get("content-range"))
+            if total is None and len(content) < chunk_bytes:
+                total = offset
+            small_chunks = bool(progress(offset, total, str(partial))) if progress else False
+    os.replace(partial, dest)
+    return offset
+
+def download_drive_pdf(file_id: str, dest: Path, revision: str = "", export: bool = False, progress=None) -> bool:
+    """Drive PDF 원본(export=True면 구글 프레젠테이션의 PDF 내보내기)을 dest 파일로 스트리밍합니다.
+    내보내기 실패(용량 제한 등)는 호출 측에서 썸네일 방식으로 대체하므로 오류를 표시하지 않습니다."""
+    service = get_drive_service()
+    creds = get_google_credentials(DRIVE_SCOPES)
+    if service is None or creds is None: return False
+    if export:
+        uri = service.files().export_media(fileId=file_id, mimeType="application/pdf").uri
+    else:
+        uri = service.files().get_media(fileId=file_id).uri
+    try:
+        # 리비전을 모르면 이전 조각이 다른 내용일 수 있으므로 처음부터 받음
+        stream_download(_thread_authorized_http(creds), uri, dest, progress, resume=bool(revision))
+        return True
+    except Exception as e:
+        if not export:
+            st.error(f"PDF 파일 다운로드 실패: {e}")
+        return False
 
-@st.cache_data(ttl=3600, max_entries=5, show_spinner=False)
-def get_drive_pdf_bytes(file_id: str) -> Optional[bytes]:
-    """Drive API를 사용해 PDF 원본을 바이트로 다운로드합니다."""
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_drive_file_revision(file_id: str) -> str:
     service = get_drive_service()
-    if service is None: return None
+    if service is None: return ""
+    meta = call_google_api("drive", lambda: service.files().get(fileId=file_id, fields="modifiedTime,md5Checksum").execute())
+    return meta.get("md5Checksum") or meta.get("modifiedTime") or ""
+
+def get_drive_file_revision(file_id: str) -> str:
+    """파일이 바뀌면 달라지는 리비전 식별자(md5Checksum, 없으면 modifiedTime)를 반환합니다. 실패 시 빈 문자열(캐시하지 않음)"""
     try:
-        request = service.files().get_media(fileId=file_id)
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
-        done = False
-        while done is False:
-            status, done = downloader.next_chunk()
-        return fh.getvalue()
+        return _fetch_drive_file_revision(file_id)
     except Exception as e:
-        st.error(f"PDF 파일 다운로드 실패: {e}")
+        return ""
+
+@st.cache_resource(show_spinner=False)
+def get_pdf_cache_counters() -> dict:
+    return {"lock": threading.Lock(), "hits": 0, "misses": 0, "evictions": 0}
+
+def _count_pdf_cache(**deltas):
+    counters = get_pdf_cache_counters()
+    with counters["lock"]:
+        for name, delta in deltas.items():
+            counters[name] += delta
+
+def get_pdf_cache_stats() -> dict:
+    """PDF 원본 캐시 현황: 적중/미스/정리 횟수와 현재 사용 용량(바이트)"""
+    counters = get_pdf_cache_counters()
+    with counters["lock"]:
+        stats = {name: counters[name] for name in ("hits", "misses", "evictions")}
+    directory = CACHE_DIR / "pdf_src"
+    try:
+        stats["bytes"] = sum(e.stat().st_size for e in os.scandir(directory) if e.is_file())
+    except OSError:
+        stats["bytes"] = 0
+    stats["max_bytes"] = PDF_CACHE_MAX_BYTES
+    return stats
+
+def _touch_pdf_source(path: Path) -> bool:
+    try:
+        os.utime(path)  # LRU 순서 갱신 (mtime = 마지막 사용 시각)
+        return True
+    except OSError:
+        return False
+
+@st.cache_resource(show_spinner=False)
+def get_unversioned_pdf_downloads() -> dict:
+    """리비전을 모르는 PDF의 {(file_id, export): 받은 시각}"""
+    return {}
+
+def _reuse_pdf_source(path: Path, file_id: str, revision: str, export: bool) -> bool:
+    """디스크의 PDF를 그대로 써도 되는지. 리비전을 모르면 받은 지 PDF_UNVERSIONED_TTL_SECONDS 이내인 파일만 재사용합니다."""
+    if not revision:
+        downloaded_at = get_unversioned_pdf_downloads().get((file_id, export))
+        if downloaded_at is None or time.time() - downloaded_at > PDF_UNVERSIONED_TTL_SECONDS:
+            return False
+    return _touch_pdf_source(path)
+
+def get_pdf_source_path(file_id: str, revision: str, export: bool = False, progress=None) -> Optional[str]:
+    """워커 프로세스들이 바이트 복사 없이 직접 열 수 있도록 PDF 원본을 디스크 파일로 내려둡니다.
+    export=True면 구글 프레젠테이션을 PDF로 내보낸 결과를 사용합니다. progress는 다운로드 진행률 콜백.
+
+    PDF를 파이썬 bytes로 메모리에 쌓아두지 않고 총 용량(PDF_CACHE_MAX_MB) 기준 LRU 디스크 캐시로 관리합니다.
+    fitz는 파일 경로를 직접 열기 때문에 페이지를 읽을 때 OS 페이지 캐시만 거칩니다.
+    리비전을 모르는 파일도 짧은 시간(PDF_UNVERSIONED_TTL_SECONDS) 동안은 페이지 수 조회·렌더링·'더 보기'가 같은 파일을 씁니다."""
+    path = _disk_cache_path("pdf_src", (file_id, revision), "pdf")
+    if _reuse_pdf_source(path, file_id, revision, export):
+        _count_pdf_cache(hits=1)
+        return str(path)
+
+    def _fetch() -> Optional[str]:
+        if _reuse_pdf_source(path, file_id, revision, export):
+            _count_pdf_cache(hits=1)
+            return str(path)
+        _count_pdf_cache(misses=1)
+        if not download_drive_pdf(file_id, path, revision, export, progress): return None
+        if not revision:
+            get_unversioned_pdf_downloads()[(file_id, export)] = time.time()
+        _count_pdf_cache(evictions=evict_disk_cache(path.parent, PDF_CACHE_MAX_BYTES, keep=path))
+        return str(path) if path.exists() else None
+
+    return single_flight(("pdf_src", file_id, revision, export), _fetch)
+
+def get_pdf_page_count(file_id: str, revision: str, export: bool = False, progress=None, pdf_path: Optional[str] = None) -> int:
+    """pdf_path를 주면 이미 내려받은 파일을 그대로 사용합니다."""
+    key = ("page_count", file_id, revision)
+    if revision:
+        cached = disk_cache_get("pdf_pages", key, "json")
+        if cached is not None:
+            return int(json.loads(cached))
+
+    pdf_path = pdf_path or get_pdf_source_path(file_id, revision, export, progress)
+    if not pdf_path: return 0
+    import pdf_render
+    count = pdf_render.count_pages(pdf_path)
+    if revision:
+        disk_cache_put("pdf_pages", key, "json", json.dumps(count).encode("utf-8"), PAGE_CACHE_MAX_BYTES)
+    return count
+
+@st.cache_resource(show_spinner=False)
+def get_render_pool() -> ProcessPoolExecutor:
+    # fitz는 GIL을 놓지 않으므로 스레드가 아닌 프로세스로 분산 (spawn: 서버 스레드 상태를 복제하지 않음)
+    return ProcessPoolExecutor(max_workers=PDF_RENDER_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+def lookup_pdf_page_assets(file_id: str, revision: str, page_num: int) -> Optional[dict]:
+    """(파일, 리비전, 페이지, 티어 설정) → 에셋 매핑이 디스크에 있으면 렌더링 없이 바로 반환합니다.
+
+    반환값: {"width": pt, "height": pt, "tiers": {티어명: [에셋 파일명, 픽셀 너비]}}"""
+    if not revision:
         return None
+    ref = disk_cache_get("pdf_pages", (file_id, revision, page_num, PDF_PAGE_TIERS), "json")
+    if not ref:
+        return None
+    page_info = json.loads(ref)
+    if all(touch_static_asset(name) for name, _ in page_info["tiers"].values()):
+        return page_info
+    return None
+
+def store_pdf_page_assets(file_id: str, revision: str, rendered: dict) -> dict:
+    """워커가 인코딩한 페이지 이미지를 정적 에셋으로 내보내고 매핑을 디스크에 기록합니다."""
+    page_info = {"width": rendered["width"], "height": rendered["height"], "tiers": {}}
+    for tier, (data, fmt, width) in rendered["tiers"].items():
+        page_info["tiers"][tier] = [publish_static_asset(data, fmt), width]
+    if revision:
+        key = (file_id, revision, rendered["page"], PDF_PAGE_TIERS)
+        disk_cache_put("pdf_pages", key, "json", json.dumps(page_info).encode("utf-8"), PAGE_CACHE_MAX_BYTES)
+    return page_info
+
+def iter_pdf_page_assets(file_id: str, revision: str, page_nums: List[int], export: bool = False, pdf_path: Optional[str] = None, progress=None):
+    """요청한 페이지들의 에셋을 (페이지 번호, page_info) 형태로 완료되는 순서대로 내보냅니다.
+    캐시에 없는 페이지는 프로세스 풀에서 병렬로 래스터화합니다. pdf_path를 주면 그 파일을 그대로 사용합니다."""
+    missing = []
+    for page_num in page_nums:
+        page_info = lookup_pdf_page_assets(file_id, revision, page_num)
+        if page_info:
+            yield page_num, page_info
+        else:
+            missing.append(page_num)
+    if not missing:
+        return
+
+    pdf_path = pdf_path or get_pdf_source_path(file_id, revision, export, progress)
+    if not pdf_path:
+        return
+    import pdf_render
+    try:
+        pool = get_render_pool()
+        # 다른 세션이 같은 페이지를 렌더링 중이면 새로 제출하지 않고 그 작업 결과를 함께 사용
+        futures = [
+            shared_future(
+                ("render", file_id, revision, p, PDF_PAGE_TIERS),
+                lambda p=p: pool.submit(pdf_render.rasterize_page, pdf_path, p, PDF_PAGE_TIERS),
+            )
+            for p in missing
+        ]
+        for future in as_completed(futures):
+            rendered = future.result()
+            yield rendered["page"], store_pdf_page_assets(file_id, revision, rendered)
+    except BrokenProcessPool:
+        # 워커가 죽은 경우(메모리 부족 등) 풀을 새로 만들도록 비우고, 이번 요청은 현재 프로세스에서 처리
+        get_render_pool.clear()
+        for p in missing:
+            if lookup_pdf_page_assets(file_id, revision, p) is None:
+                rendered = pdf_render.rasterize_page(pdf_path, p, PDF_PAGE_TIERS, keep_open=False)
+                yield p, store_pdf_page_assets(file_id, revision, rendered)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -687,6 +1824,452 @@ def build_embed_url_if_possible(url: str, page_range: str = "") -> str:
     return url
 
 
+# ─────────────────────────────────────────────────────────────
+# 검색 – 한글 자모 n-gram 색인
+# ─────────────────────────────────────────────────────────────
+SEARCH_MIN_SCORE = 0.5  # 검색어 n-gram 중 이 비율 이상이 일치해야 결과로 인정
+
+def decompose_hangul(text: str) -> str:
+    """소문자화 후 한글 음절을 초성/중성/종성 자모로 풀어, 오타·받침 차이에도 부분 일치하도록 합니다."""
+    out = []
+    for ch in text.lower():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(chr(0x1100 + code // 588))
+            out.append(chr(0x1161 + (code % 588) // 28))
+            if code % 28:
+                out.append(chr(0x11A7 + code % 28))
+        elif ch.isalnum():
+            out.append(ch)
+    return "".join(out)
+
+def text_ngrams(text: str, n: int = 2) -> frozenset:
+    jamo = decompose_hangul(text)
+    if len(jamo) <= n:
+        return frozenset([jamo]) if jamo else frozenset()
+    return frozenset(jamo[i:i + n] for i in range(len(jamo) - n + 1))
+
+def build_search_index(docs: dict, previous: Optional[dict] = None) -> dict:
+    """docs({문서 id: 텍스트})로 n-gram 역색인을 만듭니다.
+    previous가 주어지면 텍스트가 바뀐 문서만 다시 색인하고 나머지 posting은 그대로 재사용합니다."""
+    prev_docs = previous["docs"] if previous else {}
+    postings = dict(previous["postings"]) if previous else {}
+    copied = set()  # 이전 색인과 공유 중인 posting은 수정 전에 복사 (읽는 중인 세션 보호)
+
+    def _edit(gram):
+        if gram not in copied:
+            postings[gram] = set(postings.get(gram, ()))
+            copied.add(gram)
+        return postings[gram]
+
+    new_docs = {}
+    for doc_id, text in docs.items():
+        old = prev_docs.get(doc_id)
+        if old is not None and old[0] == text:
+            new_docs[doc_id] = old
+            continue
+        grams = text_ngrams(text)
+        if old is not None:
+            for gram in old[1] - grams:
+                _edit(gram).discard(doc_id)
+        for gram in grams - (old[1] if old is not None else frozenset()):
+            _edit(gram).add(doc_id)
+        new_docs[doc_id] = (text, grams)
+    for doc_id in prev_docs.keys() - docs.keys():
+        for gram in prev_docs[doc_id][1]:
+            _edit(gram).discard(doc_id)
+    return {"docs": new_docs, "postings": postings}
+
+def search_index(index: dict, query: str, limit: Optional[int] = None) -> List[str]:
+    """일치한 n-gram 비율이 높은 순(동률이면 짧은 문서 우선)으로 문서 id를 반환합니다."""
+    q_grams = text_ngrams(query)
+    if not q_grams:
+        return []
+    counts = {}
+    for gram in q_grams:
+        for doc_id in index["postings"].get(gram, ()):
+            counts[doc_id] = counts.get(doc_id, 0) + 1
+    min_hits = max(1, int(len(q_grams) * SEARCH_MIN_SCORE + 0.999))
+    hits = [(c, doc_id) for doc_id, c in counts.items() if c >= min_hits]
+    hits.sort(key=lambda h: (-h[0], len(index["docs"][h[1]][0])))
+    return [doc_id for _, doc_id in hits[:limit]]
+
+@st.cache_resource(show_spinner=False)
+def get_search_index_store() -> dict:
+    return {"lock": threading.Lock(), "indexes": {}}
+
+def get_search_index(name: str, df: pd.DataFrame, key_cols: List[str], text_cols: List[str]) -> dict:
+    """데이터 버전이 바뀌었을 때만 (변경된 행에 한해) 색인을 갱신합니다.
+    문서 id는 key_cols(stable id)로 만들어 행 순서가 바뀌어도 같은 문서로 취급되고,
+    반환값의 positions는 문서 id → 현재 데이터의 행 위치 목록입니다."""
+    data_version = get_data_version(df)
+    store = get_search_index_store()
+    with store["lock"]:
+        current = store["indexes"].get(name)
+        if current is not None and current["data_version"] == data_version:
+            return current
+
+        keys = df[key_cols[0]].astype(str)
+        for col in key_cols[1:]:
+            keys = keys + "|" + df[col].astype(str)
+        texts = df[text_cols[0]].astype(str)
+        for col in text_cols[1:]:
+            texts = texts + " " + df[col].astype(str)
+        docs = {}
+        positions = {}
+        for pos, (doc_id, text) in enumerate(zip(keys, texts)):
+            docs[doc_id] = text
+            positions.setdefault(doc_id, []).append(pos)
+        index = build_search_index(docs, current["index"] if current else None)
+        current = {"data_version": data_version, "index": index, "positions": positions}
+        store["indexes"][name] = current
+        return current
+
+def search_rows(name: str, df: pd.DataFrame, key_cols: List[str], text_cols: List[str], query: str) -> List[int]:
+    """검색어와 일치하는 행 위치를 관련도 순으로 반환합니다."""
+    search = get_search_index(name, df, key_cols, text_cols)
+    rows = []
+    for doc_id in search_index(search["index"], query):
+        rows.extend(search["positions"].get(doc_id, []))
+    return rows
+
+
+# ─────────────────────────────────────────────────────────────
+# 리포트 본문 전문 검색 – SQLite FTS5 색인 (백그라운드 색인 스레드)
+# ─────────────────────────────────────────────────────────────
+REPORT_INDEX_PATH = CACHE_DIR / "report_text.sqlite3"
+REPORT_INDEX_INTERVAL_SECONDS = 1800
+REPORT_INDEX_ENABLED = bool(st.secrets.get("REPORT_INDEX_ENABLED", True))
+# 색인용 PDF는 pdf_src 캐시와 분리된 임시 경로로 받아 추출 직후 삭제
+REPORT_INDEX_DOWNLOAD_DIR = CACHE_DIR / "report_index_tmp"
+# 색인용 텍스트 추출 워커 수 (화면 렌더링용 PDF_RENDER_WORKERS와 별도)
+REPORT_INDEX_WORKERS = 1
+
+# 슬라이드의 도형/표 텍스트만 받아오는 필드 마스크
+SLIDE_TEXT_FIELDS = (
+    "slides(pageElements(shape(text(textElements(textRun(content)))),"
+    "table(tableRows(tableCells(text(textElements(textRun(content))))))))"
+)
+
+def _report_index_connect() -> sqlite3.Connection:
+    REPORT_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(REPORT_INDEX_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")  # 색인 스레드가 쓰는 동안에도 검색 가능
+    conn.execute("CREATE TABLE IF NOT EXISTS sources (source_id TEXT PRIMARY KEY, kind TEXT, revision TEXT)")
+    # trigram 토크나이저: 띄어쓰기 단위가 아닌 부분 문자열로 한국어 본문을 검색
+    conn.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS pages USING fts5("
+        "text, source_id UNINDEXED, kind UNINDEXED, page UNINDEXED, tokenize='trigram')"
+    )
+    return conn
+
+def _collect_text_runs(elements: list) -> str:
+    return "".join(te.get("textRun", {}).get("content", "") for te in elements)
+
+def extract_slide_texts(service, presentation_id: str, limiters: Optional[dict] = None) -> List[str]:
+    """Slides API에서 슬라이드별 텍스트를 추출합니다. (도형 + 표 셀)"""
+    pres = call_google_api(
+        "slides", lambda: service.presentations().get(presentationId=presentation_id, fields=SLIDE_TEXT_FIELDS).execute(),
+        limiters=limiters,
+    )
+    texts = []
+    for slide in pres.get("slides", []):
+        parts = []
+        for el in slide.get("pageElements", []):
+            parts.append(_collect_text_runs(el.get("shape", {}).get("text", {}).get("textElements", [])))
+            for row in el.get("table", {}).get("tableRows", []):
+                for cell in row.get("tableCells", []):
+                    parts.append(_collect_text_runs(cell.get("text", {}).get("textElements", [])))
+        texts.append("\n".join(p for p in parts if p))
+    return texts
+
+def extract_pdf_texts(ctx: dict, file_id: str) -> List[str]:
+    """색인 전용 임시 파일로 PDF를 받아 텍스트만 추출하고 지웁니다.
+    (화면 표시용 pdf_src LRU 캐시에 색인용 파일이 섞여 사용자가 보는 PDF를 밀어내지 않도록)"""
+    dest = REPORT_INDEX_DOWNLOAD_DIR / f"{file_id}.pdf"
+    uri = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+    try:
+        stream_download(_thread_authorized_http(ctx["drive_creds"]), uri, dest, resume=False, limiters=ctx["limiters"])
+        import pdf_render
+        return ctx["text_pool"].submit(pdf_render.extract_page_texts, str(dest)).result()
+    finally:
+        dest.unlink(missing_ok=True)
+        dest.with_name(f"{dest.name}.part.tmp").unlink(missing_ok=True)
+
+def index_report_source(conn: sqlite3.Connection, ctx: dict, source_id: str, kind: str) -> bool:
+    """리비전이 바뀐 소스만 페이지 텍스트를 다시 추출해 색인합니다. 색인을 갱신했으면 True.
+    ctx는 스크립트 실행 중에 받아 둔 인증 정보·호출량 제한과 색인 스레드의 service·텍스트 추출 풀입니다.
+    (색인 스레드는 st.*를 호출하지 않음)"""
+    meta = call_google_api(
+        "drive", lambda: ctx["drive"].files().get(fileId=source_id, fields="modifiedTime,md5Checksum").execute(),
+        limiters=ctx["limiters"],
+    )
+    revision = meta.get("md5Checksum") or meta.get("modifiedTime") or ""
+    if not revision:
+        return False
+    row = conn.execute("SELECT revision FROM sources WHERE source_id = ?", (source_id,)).fetchone()
+    if row and row[0] == revision:
+        return False
+    texts = extract_pdf_texts(ctx, source_id) if kind == "pdf" else extract_slide_texts(ctx["slides"], source_id, ctx["limiters"])
+    with conn:
+        conn.execute("DELETE FROM pages WHERE source_id = ?", (source_id,))
+        conn.executemany(
+            "INSERT INTO pages (text, source_id, kind, page) VALUES (?, ?, ?, ?)",
+            [(text, source_id, kind, page) for page, text in enumerate(texts, start=1) if text.strip()],
+        )
+        conn.execute("INSERT OR REPLACE INTO sources (source_id, kind, revision) VALUES (?, ?, ?)", (source_id, kind, revision))
+    return True
+
+# 본문 검색 결과(source_id)를 행으로 연결할 때 보는 링크 열: 종류 → (열 목록, 링크에서 id 추출 함수)
+REPORT_SOURCE_COLUMNS = {
+    "monthly": (["url"], extract_drive_file_id),
+    "actor": (["actor_url", "url"], extract_presentation_id),
+    "genre": (["genre_url", "url"], extract_presentation_id),
+}
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_report_source_index(_df: pd.DataFrame, data_version: str, kind: str) -> dict:
+    """source_id(Drive 파일 / 프레젠테이션 id) → 행 위치 목록 (데이터 버전마다 한 번만 생성)
+    배우/장르 행은 전용 링크가 비어 있으면 공통 url 열의 덱을 사용합니다."""
+    cols, extract = REPORT_SOURCE_COLUMNS[kind]
+    positions = {}
+    if _df.empty:
+        return positions
+    for pos, values in enumerate(zip(*(_df[c] for c in cols))):
+        source_id = extract(next((v for v in values if v), None))
+        if source_id:
+            positions.setdefault(source_id, []).append(pos)
+    return positions
+
+def get_report_source_index(df: pd.DataFrame, kind: str) -> dict:
+    return build_report_source_index(df, get_data_version(df), kind)
+
+def list_report_sources(df_monthly: pd.DataFrame, df_archive: pd.DataFrame) -> List[tuple]:
+    """색인 대상 (source_id, kind): 월간 PDF 파일과 배우/장르 분석 덱"""
+    sources = {file_id: "pdf" for file_id in get_report_source_index(df_monthly, "monthly")}
+    for kind in ("actor", "genre"):
+        for pres_id in get_report_source_index(df_archive, kind):
+            sources.setdefault(pres_id, "slides")
+    return list(sources.items())
+
+@st.cache_resource(show_spinner=False)
+def get_report_indexer() -> dict:
+    """프로세스당 1개인 색인 스레드와, 스크립트 실행이 넘겨주는 색인 대상·실행 컨텍스트"""
+    return {"lock": threading.Lock(), "thread": None, "sources": [], "ctx": None, "versions": None}
+
+def _new_text_pool() -> ProcessPoolExecutor:
+    # 색인 전용 텍스트 추출 워커 (화면 렌더링 풀의 워커를 대량 재색인이 붙잡지 않도록 분리)
+    return ProcessPoolExecutor(max_workers=REPORT_INDEX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+def run_report_indexer(indexer: dict):
+    """요청 경로 밖에서 리포트 본문을 색인합니다. 필요한 값은 모두 indexer에 넘겨받은 것만 사용합니다."""
+    services = {}
+    while True:
+        with indexer["lock"]:
+            sources, ctx = list(indexer["sources"]), indexer["ctx"]
+        text_pool = None
+        try:
+            creds = (ctx["drive_creds"], ctx["slides_creds"])
+            if services.get("creds") != creds:
+                # 이 스레드 전용 service 객체 (httplib2는 스레드 간 공유 불가)
+                services = {
+                    "creds": creds,
+                    "drive": build("drive", "v3", credentials=ctx["drive_creds"], cache_discovery=False),
+                    "slides": build("slides", "v1", credentials=ctx["slides_creds"], cache_discovery=False),
+                }
+            # 추출 워커는 색인 주기 동안만 띄워 두고, 워커가 죽으면 새로 만들어 이어서 색인
+            text_pool = _new_text_pool()
+            conn = _report_index_connect()
+            try:
+                for source_id, kind in sources:
+                    run_ctx = dict(ctx, drive=services["drive"], slides=services["slides"], text_pool=text_pool)
+                    try:
+                        index_report_source(conn, run_ctx, source_id, kind)
+                    except BrokenProcessPool:
+                        logger.warning("색인 추출 워커가 종료되어 다시 시작합니다. (%s)", source_id)
+                        text_pool.shutdown(wait=False)
+                        text_pool = _new_text_pool()
+                    except Exception:
+                        # 한 파일 실패가 전체 색인을 멈추지 않도록 기록만 하고 계속
+                        logger.warning("리포트 본문 색인 실패: %s", source_id, exc_info=True)
+            finally:
+                conn.close()
+        except Exception:
+            logger.exception("리포트 본문 색인 실패")
+        finally:
+            if text_pool is not None:
+                text_pool.shutdown(wait=False)
+        time.sleep(REPORT_INDEX_INTERVAL_SECONDS)
+
+def start_report_indexer(df_monthly: pd.DataFrame, df_archive: pd.DataFrame):
+    """색인 대상과 인증 정보를 스크립트 실행 중에 넘기고, 색인 스레드가 없으면 시작합니다.
+    호출할 때마다 넘기는 값을 갱신하므로 데이터가 바뀌면 다음 색인 주기부터 새 대상 목록을 사용합니다."""
+    drive_creds = get_google_credentials(DRIVE_SCOPES)
+    slides_creds = get_google_credentials(SLIDES_SCOPES)
+    if drive_creds is None or slides_creds is None:
+        return
+    indexer = get_report_indexer()
+    versions = (get_data_version(df_monthly), get_data_version(df_archive))
+    with indexer["lock"]:
+        if indexer["versions"] != versions:
+            indexer["sources"] = list_report_sources(df_monthly, df_archive)
+            indexer["versions"] = versions
+        indexer["ctx"] = {"drive_creds": drive_creds, "slides_creds": slides_creds, "limiters": get_rate_limiters()}
+        if indexer["thread"] is not None:
+            return
+        thread = threading.Thread(target=run_report_indexer, args=(indexer,), name="report-indexer", daemon=True)
+        thread.start()
+        indexer["thread"] = thread
+
+def ensure_report_indexer():
+    """시트를 이미 불러온 화면(목록, 본문 검색)에서 색인 스레드를 시작·갱신합니다.
+    홈 화면은 시트 로딩을 기다리지 않도록 검색어가 입력되기 전에는 호출하지 않습니다."""
+    if not REPORT_INDEX_ENABLED:
+        return
+    df_monthly = load_monthly_df()
+    df_archive = load_archive_df()
+    if df_monthly.empty and df_archive.empty:
+        return
+    start_report_indexer(df_monthly, df_archive)
+
+def search_report_text(query: str, limit: int = 30) -> List[dict]:
+    """본문 검색: (source_id, kind, page, snippet) 목록. trigram 색인이라 검색어는 3글자 이상이어야 합니다."""
+    if len(query) < 3:
+        return []
+    phrase = '"' + query.replace('"', '""') + '"'
+    try:
+        conn = _report_index_connect()
+        try:
+            rows = conn.execute(
+                "SELECT source_id, kind, page, snippet(pages, 0, '<mark>', '</mark>', '…', 16) "
+                "FROM pages WHERE pages MATCH ? ORDER BY rank LIMIT ?",
+                (phrase, limit),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return []
+    return [{"source_id": r[0], "kind": r[1], "page": int(r[2]), "snippet": r[3]} for r in rows]
+
+def resolve_report_hit(hit: dict, df_monthly: pd.DataFrame, df_archive: pd.DataFrame) -> List[dict]:
+    """본문 검색 결과를 해당 페이지를 바로 여는 상세 링크로 변환합니다. (슬라이드는 그 페이지를 범위에 포함한 분석만)
+    source_id → 행 위치 인덱스로 바로 찾으므로 검색 결과 수만큼 전체 행을 다시 훑지 않습니다."""
+    links = []
+    page = hit["page"]
+    if hit["kind"] == "pdf":
+        for pos in get_report_source_index(df_monthly, "monthly").get(hit["source_id"], []):
+            row = df_monthly.iloc[pos]
+            links.append({"title": row["title"], "label": "월간 리포트", "href": f"?view=monthly_detail&id={row['stable_id']}&page={page}"})
+        return links
+    actor_rows = get_report_source_index(df_archive, "actor").get(hit["source_id"], [])
+    genre_rows = get_report_source_index(df_archive, "genre").get(hit["source_id"], [])
+    for pos in sorted(set(actor_rows) | set(genre_rows)):
+        row = df_archive.iloc[pos]
+        if pos in actor_rows and page in parse_page_range(row["actor_range"]):
+            title = f"{row['cast_clean'] or row['cast'] or '배우 정보 없음'} ({row['ip']})"
+            links.append({"title": title, "label": "캐스팅 분석", "href": f"?view=actor_detail&id={row['actor_stable_id']}&page={page}"})
+        if pos in genre_rows and page in parse_page_range(row["genre_range"]):
+            title = f"{row['genre_title'] or '장르 분석'} ({row['ip']})"
+            links.append({"title": title, "label": "장르 분석", "href": f"?view=genre_detail&id={row['genre_stable_id']}&page={page}"})
+    return links
+
+
+# ─────────────────────────────────────────────────────────────
+# 리스트 카드 HTML 조각 캐시 – (행 내용 해시, 템플릿 버전) 단위
+# ─────────────────────────────────────────────────────────────
+# 카드 마크업을 바꾸면 이 값을 올려 기존 조각을 무효화
+CARD_TEMPLATE_VERSION = 2
+# 리스트 한 번에 보여줄 카드 수 (나머지는 '더 보기'로 이어서 표시)
+LIST_PAGE_SIZE = int(st.secrets.get("LIST_PAGE_SIZE", 24))
+
+@st.cache_resource(show_spinner=False)
+def get_card_fragment_store() -> dict:
+    """프로세스 전체에서 공유하는 카드 조각 저장소 {(종류, 행 해시, 템플릿 버전): 조각}"""
+    return {"lock": threading.Lock(), "fragments": {}}
+
+def _monthly_card_fragment(row: dict) -> tuple:
+    """(file_id, 썸네일 앞 HTML, 썸네일 뒤 HTML). 썸네일 링크는 시간이 지나면 바뀌므로 렌더링 시점에 끼워 넣습니다."""
+    title = row["title"]
+    link = f"?view=monthly_detail&id={row.get('stable_id') or row['row_id']}"
+    head = f'<a href="{link}" target="_self" class="monthly-card"><div class="monthly-thumb-box"><img src="'
+    tail = f'" class="monthly-thumb" alt="{title}" loading="lazy" decoding="async"></div><div class="monthly-info"><div class="monthly-title">{title}</div><div class="monthly-date">발행시점 : {row["date"]}</div></div></a>'
+    return extract_drive_file_id(row["url"]), head, tail
+
+def _analysis_card_html(link: str, title_display: str, label: str, row: dict) -> str:
+    date_str = row["date"] if row["date"] else "미상"
+    air_str = row["air"] if row["air"] else "미상"
+    meta = f"분석시점 : {date_str} / IP방영시점 : {air_str}"
+    # 들여쓰기로 인한 코드블록 인식 오류를 막기 위해 한 줄 문자열 연결 방식 사용
+    return (
+        f'<a href="{link}" target="_self" class="analysis-card" style="margin-bottom: 12px;">'
+        f'<div class="analysis-title-row"><div class="analysis-ip">{title_display}</div>'
+        f'<div class="analysis-label">{label}</div></div>'
+        f'<div class="analysis-meta">{meta}</div>'
+        f'<div class="analysis-sub">작품: {row["ip"]}</div></a>'
+    )
+
+def _actor_card_fragment(row: dict) -> str:
+    link = f"?view=actor_detail&id={row.get('actor_stable_id') or row['row_id']}"
+    cast_text = (row["cast_clean"] or row["cast"]) or "배우 정보 없음"
+    return _analysis_card_html(link, f"{cast_text} ({row['ip']})", "캐스팅 분석", row)
+
+def _genre_card_fragment(row: dict) -> str:
+    link = f"?view=genre_detail&id={row.get('genre_stable_id') or row['row_id']}"
+    title = row["genre_title"] or "장르 분석"
+    return _analysis_card_html(link, f"{title} ({row['ip']})", "장르 분석", row)
+
+CARD_FRAGMENT_BUILDERS = {
+    "monthly": _monthly_card_fragment,
+    "actor": _actor_card_fragment,
+    "genre": _genre_card_fragment,
+}
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def build_card_fragments(_df: pd.DataFrame, data_version: str, kind: str) -> list:
+    """행 위치 → 카드 조각 목록 (데이터 버전마다 한 번만 생성)
+
+    조각 자체는 행 내용 해시로 보관하므로 시트가 갱신돼도 바뀐 행의 카드만 새로 만들고,
+    리스트 렌더링은 필터링된 행 위치의 조각을 이어 붙이기만 합니다."""
+    builder = CARD_FRAGMENT_BUILDERS[kind]
+    row_hashes = pd.util.hash_pandas_object(_df, index=False).tolist()
+    store = get_card_fragment_store()
+    result = []
+    with store["lock"]:
+        fragments = store["fragments"]
+        current = set()
+        for row_hash, row in zip(row_hashes, _df.to_dict("records")):
+            key = (kind, row_hash, CARD_TEMPLATE_VERSION)
+            fragment = fragments.get(key)
+            if fragment is None:
+                fragment = fragments[key] = builder(row)
+            current.add(key)
+            result.append(fragment)
+        # 현재 데이터에 없는 행(수정·삭제됨)이나 이전 템플릿의 조각은 정리
+        for key in [k for k in fragments if k[0] == kind and k not in current]:
+            del fragments[key]
+    return result
+
+def get_list_visible_count(name: str, signature: tuple) -> int:
+    """리스트별 표시 개수. 검색어·필터(signature)가 바뀌면 첫 페이지로 되돌립니다."""
+    state = st.session_state.get(f"list_visible_{name}")
+    if not state or state[0] != signature:
+        return LIST_PAGE_SIZE
+    return state[1]
+
+def render_list_more_button(name: str, signature: tuple, visible: int, total: int):
+    if visible >= total:
+        return
+
+    def _show_more():
+        st.session_state[f"list_visible_{name}"] = (signature, visible + LIST_PAGE_SIZE)
+
+    st.button(
+        f"더 보기 ({visible} / {total})",
+        key=f"list-more-{name}",
+        on_click=_show_more,
+        width="stretch",
+    )
+
 # ─────────────────────────────────────────────────────────────
 # 렌더링 – 홈 / 월간 / 배우·장르 리스트 / 상세
 # ─────────────────────────────────────────────────────────────
@@ -729,6 +2312,40 @@ def render_home():
         """, unsafe_allow_html=True
     )
 
+    render_report_text_search()
+
+def render_report_text_search():
+    """리포트 본문(PDF 페이지 / 슬라이드 텍스트) 전문 검색. 결과는 해당 페이지만 여는 상세 링크로 표시합니다."""
+    st.markdown("<div style='height: 40px;'></div>", unsafe_allow_html=True)
+    col_search, _ = st.columns([1, 1])
+    with col_search:
+        query = st.text_input("📄 리포트 본문 검색", placeholder="리포트 본문에 포함된 문구 (3글자 이상)").strip()
+    if not query:
+        return
+    if len(query) < 3:
+        st.info("본문 검색어는 3글자 이상 입력해 주세요.")
+        return
+
+    # 시트는 검색어가 입력된 뒤에만 불러옴 (홈 화면이 시트 로딩을 기다리지 않도록)
+    df_monthly = load_monthly_df()
+    df_archive = load_archive_df()
+    ensure_report_indexer()
+    cards = []
+    for hit in search_report_text(query):
+        # 스니펫은 원문 텍스트이므로 이스케이프 후 일치 구간만 강조
+        snippet = html.escape(hit["snippet"]).replace("&lt;mark&gt;", "<mark>").replace("&lt;/mark&gt;", "</mark>")
+        for link in resolve_report_hit(hit, df_monthly, df_archive):
+            cards.append(
+                f'<a href="{link["href"]}" target="_self" class="analysis-card" style="margin-bottom: 12px;">'
+                f'<div class="analysis-title-row"><div class="analysis-ip">{link["title"]}</div>'
+                f'<div class="analysis-label">{link["label"]} · {hit["page"]}p</div></div>'
+                f'<div class="analysis-meta">{snippet}</div></a>'
+            )
+    if not cards:
+        st.info("본문에서 일치하는 리포트를 찾지 못했습니다. (새 리포트는 색인이 끝난 뒤 검색됩니다)")
+        return
+    st.markdown("".join(cards), unsafe_allow_html=True)
+
 def render_monthly_list(df_monthly: pd.DataFrame):
     st.markdown('<a href="?view=home" target="_self" class="detail-back">← 메인으로 돌아가기</a>', unsafe_allow_html=True)
     st.markdown('<div class="detail-title">월간 드라마 인사이트 리포트</div>', unsafe_allow_html=True)
@@ -738,30 +2355,171 @@ def render_monthly_list(df_monthly: pd.DataFrame):
         st.info("등록된 월간 리포트가 없습니다. 시트를 확인해 주세요.")
         return
 
+    col_search, _ = st.columns([1, 2])
+    with col_search:
+        search_query = st.text_input("🔍 검색", placeholder="리포트 제목 (일부만 입력해도 검색)").strip()
+    rows = list(range(len(df_monthly)))
+    if search_query:
+        rows = search_rows("monthly", df_monthly, ["stable_id"], ["title"], search_query)
+        if not rows:
+            st.info("검색 결과가 없습니다.")
+            return
+
+    signature = (search_query,)
+    visible = get_list_visible_count("monthly", signature)
+    fragments = build_card_fragments(df_monthly, get_data_version(df_monthly), "monthly")
+    cards = [fragments[pos] for pos in rows[:visible]]
+
+    # 화면에 표시할 카드의 썸네일 링크만 페이지 단위로 조회 ('더 보기'로 늘어난 페이지만 새로 요청되고 앞 페이지는 캐시 사용)
+    thumb_urls = {}
+    for start in range(0, len(cards), LIST_PAGE_SIZE):
+        page_ids = tuple(file_id for file_id, _, _ in cards[start:start + LIST_PAGE_SIZE] if file_id)
+        thumb_urls.update(get_drive_thumbnail_urls(page_ids))
+
     cols_html = ['<div class="monthly-grid">']
-    
-    for _, row in df_monthly.iterrows():
-        title = row["title"]
-        date = row["date"]
-        url = row["url"]
-        
-        file_id = extract_drive_file_id(url)
-        thumb_url = ""
-        
+    for file_id, head, tail in cards:
         if file_id:
-            thumb_url = get_drive_thumbnail_url(file_id) or "https://via.placeholder.com/640x360?text=No+Thumbnail"
+            thumb_url = thumb_urls.get(file_id) or "https://via.placeholder.com/640x360?text=No+Thumbnail"
         else:
             thumb_url = "https://via.placeholder.com/640x360?text=Invalid+Link"
-
-        link = f"?view=monthly_detail&id={row.get('stable_id') or row['row_id']}"
-        
-        card_html = f'<a href="{link}" target="_self" class="monthly-card"><div class="monthly-thumb-box"><img src="{thumb_url}" class="monthly-thumb" alt="{title}"></div><div class="monthly-info"><div class="monthly-title">{title}</div><div class="monthly-date">발행시점 : {date}</div></div></a>'
-        cols_html.append(card_html)
-        
+        cols_html.append(head + thumb_url + tail)
     cols_html.append("</div>")
     st.markdown("".join(cols_html), unsafe_allow_html=True)
+    render_list_more_button("monthly", signature, visible, len(rows))
+
+def build_pdf_page_html(page_info: dict) -> str:
+    """저해상도 미리보기를 배경으로 깔고, 그 위에 srcset 이미지가 로드되면 덮어쓰는 페이지 HTML"""
+    tiers = dict(page_info["tiers"])
+    preview_name, _ = tiers.pop("preview")
+    srcset = ", ".join(f"{static_asset_url(name)} {width}w" for name, width in tiers.values())
+    fallback_name, _ = next(iter(tiers.values()))
+    aspect = f'{page_info["width"]:.2f} / {page_info["height"]:.2f}'
+    return (
+        f'<div class="pdf-page-frame" style="aspect-ratio:{aspect}; background-image:url(\'{static_asset_url(preview_name)}\');">'
+        f'<img src="{static_asset_url(fallback_name)}" srcset="{srcset}" sizes="(max-width: 1200px) 100vw, 1120px" '
+        f'class="pdf-page-img" decoding="async"></div>'
+    )
+
+def render_pdf_pages(file_id: str, revision: str, page_count: int, only_page: Optional[int] = None,
+                     progress=None, placeholders: tuple = ()):
+    """앞쪽 PDF_PAGE_BATCH 페이지만 먼저 그리고, 나머지는 '더 보기'를 누를 때마다 이어서 렌더링합니다.
+    only_page(0부터 시작)가 주어지면 그 페이지 하나만 렌더링합니다. (본문 검색 결과 바로가기)
+    progress는 원본을 다시 받아야 할 때의 다운로드 진행률 콜백이고, placeholders(진행률·미리보기 자리)는
+    첫 페이지가 그려질 때 비워 미리보기와 실제 페이지 사이에 빈 화면이 생기지 않게 합니다."""
+    state_key = f"pdf_visible_pages_{file_id}"
+    visible = min(st.session_state.get(state_key, PDF_PAGE_BATCH), page_count)
+    page_nums = [only_page] if only_page is not None else list(range(visible))
+
+    # 페이지마다 개별 요소로 내보내 첫 페이지가 문서 길이와 무관하게 바로 표시되도록 함
+    with st.container(key=f"pdf-viewer-{file_id}"):
+        # 자리(placeholder)를 페이지 순서대로 먼저 잡아두고, 렌더링이 끝나는 대로 채움
+        slots = {page_num: st.empty() for page_num in page_nums}
+        for page_num, page_info in iter_pdf_page_assets(file_id, revision, page_nums, progress=progress):
+            # st.image 대신 HTML 태그를 사용해 완벽한 CSS(테두리, 여백 등) 제어 적용
+            # base64 인라인 대신 정적 URL을 참조해 브라우저가 병렬로 받고 캐시하도록 함
+            slots[page_num].markdown(build_pdf_page_html(page_info), unsafe_allow_html=True)
+            if page_num == page_nums[0]:
+                for placeholder in placeholders:
+                    placeholder.empty()
+        for placeholder in placeholders:
+            placeholder.empty()
+
+        if only_page is None and visible < page_count:
+            def _show_more():
+                st.session_state[state_key] = visible + PDF_PAGE_BATCH
+
+            st.button(
+                f"다음 페이지 더 보기 ({visible} / {page_count})",
+                key=f"pdf-more-{file_id}",
+                on_click=_show_more,
+                width="stretch",
+            )
+
+def get_requested_page(page_count: int) -> Optional[int]:
+    """?page= 파라미터(1부터 시작)를 0부터 시작하는 페이지 번호로 변환합니다. 범위 밖이면 None."""
+    if PAGE_PARAM is None or not str(PAGE_PARAM).isdigit():
+        return None
+    page = int(PAGE_PARAM)
+    return page - 1 if 1 <= page <= page_count else None
+
+def render_single_page_notice(page: int, full_href: str):
+    st.markdown(
+        f'<div class="viewer-wrapper" style="margin-bottom:16px; font-size:14px; color:#666;">'
+        f'본문 검색 결과 {page}페이지만 표시 중입니다. '
+        f'<a href="{full_href}" target="_self" style="color:#ff7a50; font-weight:600;">전체 보기 →</a></div>',
+        unsafe_allow_html=True,
+    )
 
 # ===== 수정: 상세 뷰어 가로폭 제한 래퍼(viewer-wrapper) 및 페이지 이미지 테두리 적용 =====
+def build_inline_page_html(rendered: dict) -> str:
+    """워커 렌더링 결과를 정적 에셋으로 저장하지 않고 data URI로 바로 그리는 임시 페이지 HTML"""
+    data, fmt, _ = next(iter(rendered["tiers"].values()))
+    aspect = f'{rendered["width"]:.2f} / {rendered["height"]:.2f}'
+    src = f"data:image/{fmt};base64,{base64.b64encode(data).decode('ascii')}"
+    return f'<div class="pdf-page-frame" style="aspect-ratio:{aspect};"><img src="{src}" class="pdf-page-img"></div>'
+
+def make_progressive_preview(file_id: str, progress_slot, page_slot, show_first_page: bool = True):
+    """다운로드 진행률을 표시하면서, 선형화 PDF면 받은 앞부분만으로 첫 페이지를 먼저 그리는 progress 콜백을 만듭니다.
+
+    파일 앞부분의 선형화 사전에서 첫 페이지 구간의 끝(/E)을 읽어 두고, 그만큼 받았을 때 한 번만 프로세스 풀에 렌더링을
+    맡긴 뒤 PDF_PREVIEW_WAIT_SECONDS까지 결과를 기다립니다. 미리보기 여부가 정해질 때까지는 작은 청크로 받아
+    /E 도착과 렌더링 완료를 곧바로 확인합니다. 선형화 PDF가 아니면 그 뒤로는 시도하지 않습니다.
+    미리보기는 다운로드 중에만 보이는 임시 이미지이고, 정식 페이지 에셋은 다운로드가 끝난 완성본으로 다시 렌더링합니다."""
+    import pdf_render
+    state = {"first_page_end": None, "future": None, "finished": not show_first_page}
+
+    def _show(future) -> bool:
+        state["finished"] = True
+        rendered = future.result() if future.exception() is None else None
+        if rendered:
+            # 뷰어와 같은 틀(pdf-viewer-*)에 표시
+            with page_slot.container(key=f"pdf-viewer-preview-{file_id}"):
+                st.markdown(build_inline_page_html(rendered), unsafe_allow_html=True)
+        return False
+
+    def _on_progress(done: int, total: Optional[int], partial_path: str) -> bool:
+        show_download_progress(progress_slot, done, total)
+        if state["finished"]:
+            return False
+        future = state["future"]
+        if future is not None:
+            return _show(future) if future.done() else True
+        if state["first_page_end"] is None:
+            try:
+                with open(partial_path, "rb") as f:
+                    info = pdf_render.read_linearization(f.read(pdf_render.LINEARIZATION_SCAN_BYTES))
+            except OSError:
+                return True
+            if info is None:
+                return True  # 아직 판단할 만큼 받지 못함
+            if not info:
+                state["finished"] = True  # 선형화 PDF가 아님 → 다운로드 완료 후 일반 경로로 렌더링
+                return False
+            state["first_page_end"] = info["E"]
+        if done < state["first_page_end"]:
+            return True
+        try:
+            future = state["future"] = get_render_pool().submit(
+                pdf_render.rasterize_partial_first_page, partial_path, state["first_page_end"], PDF_PREVIEW_TIERS
+            )
+        except BrokenProcessPool:
+            state["finished"] = True  # 미리보기는 포기하고 다운로드 완료 후 일반 경로로 렌더링
+            return False
+        try:
+            future.result(timeout=PDF_PREVIEW_WAIT_SECONDS)
+        except Exception:
+            pass  # 시간 안에 끝나지 않았거나 실패 → 다음 청크에서 다시 확인
+        return _show(future) if future.done() else True
+
+    return _on_progress
+
+def show_download_progress(slot, done: int, total: Optional[int]):
+    mb = 1024 * 1024
+    if total:
+        slot.progress(min(done / total, 1.0), text=f"PDF 내려받는 중 {done / mb:.1f} / {total / mb:.1f} MB")
+    else:
+        slot.caption(f"PDF 내려받는 중 {done / mb:.1f} MB")
+
 def render_monthly_detail(df_monthly: pd.DataFrame, row_id: str):
     row = find_row_by_identifier(df_monthly, row_id, "stable_id")
     if row.empty:
@@ -791,32 +2549,28 @@ def render_monthly_detail(df_monthly: pd.DataFrame, row_id: str):
     rendered_native = False
 
     if file_id:
-        with st.spinner("🚀 로딩중 (약 2~4초 소요)"):
-            pdf_bytes = get_drive_pdf_bytes(file_id)
-            if pdf_bytes:
-                try:
-                    import fitz
-                    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-
-                    # 뷰어 컨테이너 시작 (회색 배경, 넉넉한 여백)
-                    img_htmls = ['<div class="viewer-wrapper"><div style="background:#f9f9f9; padding:40px; border-radius:16px; border:1px solid #eaeaea; box-shadow:0 10px 30px rgba(0,0,0,0.03);">']
-
-                    for page_num in range(len(doc)):
-                        page = doc.load_page(page_num)
-                        mat = fitz.Matrix(2.0, 2.0)
-                        pix = page.get_pixmap(matrix=mat, alpha=False)
-
-                        # st.image 대신 HTML 태그를 사용해 완벽한 CSS(테두리, 여백 등) 제어 적용
-                        b64_img = base64.b64encode(pix.tobytes("png")).decode("utf-8")
-                        img_htmls.append(f'<img src="data:image/png;base64,{b64_img}" class="pdf-page-img">')
-
-                    img_htmls.append('</div></div>')
-                    st.markdown("".join(img_htmls), unsafe_allow_html=True)
-                    rendered_native = True
-                except ImportError:
-                    st.error("💡 완벽한 PDF 렌더링을 위해 `PyMuPDF` 라이브러리가 필요합니다.\n\n터미널에 `pip install PyMuPDF`를 입력하거나, `requirements.txt`에 `PyMuPDF`를 추가해 주세요!")
-                except Exception as e:
-                    st.error(f"PDF 렌더링 중 오류가 발생했습니다: {e}")
+        try:
+            progress_bar = st.empty()
+            first_page = st.empty()
+            # 특정 페이지만 여는 링크(?page=)에서는 첫 페이지 미리보기를 띄우지 않음
+            progress = make_progressive_preview(file_id, progress_bar, first_page, show_first_page=PAGE_PARAM in (None, "1"))
+            with st.spinner("🚀 로딩중 (약 2~4초 소요)"):
+                revision = get_drive_file_revision(file_id)
+                page_count = get_pdf_page_count(file_id, revision, progress=progress)
+            if page_count:
+                only_page = get_requested_page(page_count)
+                if only_page is not None:
+                    render_single_page_notice(only_page + 1, f"?view=monthly_detail&id={row.get('stable_id') or row_id}")
+                # 페이지 수는 디스크 캐시에 있지만 원본이 정리된 경우 여기서 다시 받으므로 같은 진행률·미리보기를 사용
+                render_pdf_pages(file_id, revision, page_count, only_page, progress=progress, placeholders=(progress_bar, first_page))
+                rendered_native = True
+            else:
+                progress_bar.empty()
+                first_page.empty()
+        except ImportError:
+            st.error("💡 완벽한 PDF 렌더링을 위해 `PyMuPDF` 라이브러리가 필요합니다.\n\n터미널에 `pip install PyMuPDF`를 입력하거나, `requirements.txt`에 `PyMuPDF`를 추가해 주세요!")
+        except Exception as e:
+            st.error(f"PDF 렌더링 중 오류가 발생했습니다: {e}")
 
     if not rendered_native:
         embed_url = build_embed_url_if_possible(url)
@@ -832,6 +2586,37 @@ def render_monthly_detail(df_monthly: pd.DataFrame, row_id: str):
         else:
             st.error("PDF를 불러올 수 없습니다. 올바른 구글 드라이브 링크인지 확인해 주세요.")
 
+def render_slide_range_as_pdf_pages(pres_id: str, pages: List[int]) -> bool:
+    """프레젠테이션을 PDF로 한 번 내보내 요청 범위의 페이지만 로컬에서 래스터화합니다.
+    내보낸 PDF와 렌더링 결과는 리비전 단위로 캐시되어 같은 덱의 다른 범위 요청도 재사용합니다.
+    아직 아무 페이지도 그리지 못한 채 실패하면 False를 반환해 호출 측이 썸네일 방식으로 대체하고,
+    일부를 이미 그린 뒤 실패하면 섞인 화면을 만들지 않도록 오류만 표시하고 True를 반환합니다."""
+    revision = get_drive_file_revision(pres_id)
+    # 리비전을 모르면 캐시 키가 없으므로 한 번만 내보내 페이지 수와 렌더링에 함께 사용
+    pdf_path = None if revision else get_pdf_source_path(pres_id, revision, export=True)
+    if not revision and not pdf_path:
+        return False
+    page_count = get_pdf_page_count(pres_id, revision, export=True, pdf_path=pdf_path)
+    page_nums = [p - 1 for p in pages if 0 < p <= page_count]
+    if not page_nums:
+        return False
+
+    viewer = st.empty()
+    rendered_any = False
+    try:
+        with viewer.container(key=f"slide-viewer-{pres_id}"):
+            slots = {page_num: st.empty() for page_num in page_nums}
+            for page_num, page_info in iter_pdf_page_assets(pres_id, revision, page_nums, export=True, pdf_path=pdf_path):
+                slots[page_num].markdown(build_pdf_page_html(page_info), unsafe_allow_html=True)
+                rendered_any = True
+    except Exception as e:
+        logger.exception("슬라이드 PDF 렌더링 실패: %s", pres_id)
+        if not rendered_any:
+            viewer.empty()
+            return False
+        st.error(f"일부 페이지를 렌더링하지 못했습니다: {e}")
+    return True
+
 def render_slide_range_as_thumbnails(target_url: str, page_range: str):
     pres_id = extract_presentation_id(target_url)
     if not pres_id:
@@ -863,7 +2648,16 @@ def render_slide_range_as_thumbnails(target_url: str, page_range: str):
         """, unsafe_allow_html=True)
         return
 
-    page_ids = get_presentation_page_ids(pres_id)
+    if SLIDE_RENDER_MODE == "pdf":
+        try:
+            if render_slide_range_as_pdf_pages(pres_id, pages):
+                return
+        except Exception as e:
+            # 내보내기 실패 등 아무것도 그리기 전의 오류만 여기로 옴 → 아래 썸네일 방식으로 대체
+            logger.exception("슬라이드 PDF 내보내기 실패: %s", pres_id)
+
+    revision = get_drive_file_revision(pres_id)
+    page_ids = get_presentation_page_ids(pres_id, revision)
     if not page_ids:
         embed_url = build_embed_url_if_possible(target_url, page_range)
         if not embed_url:
@@ -872,15 +2666,12 @@ def render_slide_range_as_thumbnails(target_url: str, page_range: str):
     else:
         rendered_any = False
         html_blocks = ['<div class="viewer-wrapper">']
-        for p in pages:
-            idx = p - 1
-            if 0 <= idx < len(page_ids):
-                page_obj_id = page_ids[idx]
-                thumb_url = get_slide_thumbnail_url(pres_id, page_obj_id)
-                if thumb_url:
-                    rendered_any = True
-                    # 마크다운 파서 오류(코드블록 노출)를 방지하기 위해 HTML을 한 줄로 압축
-                    html_blocks.append(f'<div class="embed-container" style="background:transparent; border:none; box-shadow:none; margin-bottom:30px;"><img src="{thumb_url}" style="position:absolute; top:0; left:0; width:100%; height:100%; object-fit:contain; border-radius:6px; border:1px solid #d4d4d4; box-shadow:0 4px 12px rgba(0,0,0,0.06);"></div>')
+        page_obj_ids = tuple(page_ids[p - 1] for p in pages if 0 <= p - 1 < len(page_ids))
+        for thumb_url in get_slide_thumbnail_urls(pres_id, revision, page_obj_ids):
+            if thumb_url:
+                rendered_any = True
+                # 마크다운 파서 오류(코드블록 노출)를 방지하기 위해 HTML을 한 줄로 압축
+                html_blocks.append(f'<div class="embed-container" style="background:transparent; border:none; box-shadow:none; margin-bottom:30px;"><img src="{thumb_url}" style="position:absolute; top:0; left:0; width:100%; height:100%; object-fit:contain; border-radius:6px; border:1px solid #d4d4d4; box-shadow:0 4px 12px rgba(0,0,0,0.06);"></div>')
         html_blocks.append('</div>')
         
         if rendered_any:
@@ -935,6 +2726,11 @@ def render_actor_detail(df: pd.DataFrame, row_id: str):
 
     target_url = row.get("actor_url") or row.get("url")
     page_range = row.get("actor_range", "")
+    pages = parse_page_range(page_range)
+    only_page = get_requested_page(max(pages, default=0))
+    if only_page is not None and only_page + 1 in pages:
+        render_single_page_notice(only_page + 1, f"?view=actor_detail&id={row.get('actor_stable_id') or row_id}")
+        page_range = str(only_page + 1)
 
     render_slide_range_as_thumbnails(target_url, page_range)
 
@@ -972,22 +2768,71 @@ def render_genre_detail(df: pd.DataFrame, row_id: str):
 
     target_url = row.get("genre_url") or row.get("url")
     page_range = row.get("genre_range", "")
+    pages = parse_page_range(page_range)
+    only_page = get_requested_page(max(pages, default=0))
+    if only_page is not None and only_page + 1 in pages:
+        render_single_page_notice(only_page + 1, f"?view=genre_detail&id={row.get('genre_stable_id') or row_id}")
+        page_range = str(only_page + 1)
 
     render_slide_range_as_thumbnails(target_url, page_range)
 
+@st.cache_resource(max_entries=4, show_spinner=False)
+def build_facet_index(_df: pd.DataFrame, data_version: str) -> dict:
+    """배우 / 분석주제 / 작품명 필터용 역색인 (데이터 버전마다 한 번만 생성)
+
+    필터 옵션 목록과 옵션 → 행 위치 집합을 미리 만들어 두고, 필터 변경 시에는 집합 연산만 수행합니다.
+    배우·분석주제는 기존과 같은 '부분 문자열 포함' 기준이며 옵션별로 처음 선택될 때 계산해 보관합니다."""
+    actor_mask = _df["actor_range"] != ""
+    genre_mask = _df["genre_range"] != ""
+
+    actor_list = _df[actor_mask]["cast_clean"].str.split(r",\s*").explode().str.strip().dropna().unique().tolist()
+    genre_list = _df[genre_mask]["genre_title"].str.strip().dropna().unique().tolist()
+
+    ip_rows = {}
+    for pos, ip in enumerate(_df["ip"]):
+        ip_rows.setdefault(ip, set()).add(pos)
+
+    return {
+        "actor_list": sorted([a for a in actor_list if a]),
+        "genre_list": sorted([g for g in genre_list if g]),
+        "ip_list": sorted(_df["ip"].dropna().unique().tolist()),
+        "actor_rows": frozenset(i for i, v in enumerate(actor_mask) if v),
+        "genre_rows": frozenset(i for i, v in enumerate(genre_mask) if v),
+        "ip_rows": {ip: frozenset(rows) for ip, rows in ip_rows.items()},
+        "cast_lower": [str(x).lower() for x in _df["cast"]],
+        "genre_lower": [str(x).lower() for x in _df["genre_title"]],
+        "substring_rows": {},
+    }
+
+def _facet_substring_rows(facets: dict, field: str, keyword: str) -> frozenset:
+    key = (field, keyword)
+    rows = facets["substring_rows"].get(key)
+    if rows is None:
+        k = keyword.lower()
+        rows = frozenset(i for i, text in enumerate(facets[field]) if k in text)
+        facets["substring_rows"][key] = rows
+    return rows
+
+def filter_rows_by_facets(facets: dict, base: str, text_field: str, keywords: List[str], ips: List[str]) -> List[int]:
+    """base 행 집합에서 keywords(부분 문자열, OR)와 ips(정확히 일치, OR)를 모두 만족하는 행 위치를 원래 순서로 반환"""
+    rows = facets[base]
+    if keywords:
+        rows = rows & frozenset().union(*(_facet_substring_rows(facets, text_field, k) for k in keywords))
+    if ips:
+        rows = rows & frozenset().union(*(facets["ip_rows"].get(ip, frozenset()) for ip in ips))
+    return sorted(rows)
+
 # ===== 캐스팅 / 장르 분석 리스트 렌더링 =====
 def render_actor_genre_list(df: pd.DataFrame):
     st.markdown('<a href="?view=home" target="_self" class="detail-back">← 메인으로 돌아가기</a>', unsafe_allow_html=True)
     st.markdown('<div class="detail-title">캐스팅 / 장르 분석 리포트</div>', unsafe_allow_html=True)
 
-    # ===== 데이터에서 존재하는 모든 배우명과 장르 키워드 추출 및 정렬 =====
-    actor_list = df[df["actor_range"] != ""]["cast_clean"].str.split(r",\s*").explode().str.strip().dropna().unique().tolist()
-    actor_list = sorted([a for a in actor_list if a])
-    
-    genre_list = df[df["genre_range"] != ""]["genre_title"].str.strip().dropna().unique().tolist()
-    genre_list = sorted([g for g in genre_list if g])
-    
-    unique_ips = sorted(df["ip"].dropna().unique().tolist())
+    # ===== 데이터에서 존재하는 모든 배우명과 장르 키워드 (데이터 버전별로 미리 만든 색인 사용) =====
+    data_version = get_data_version(df)
+    facets = build_facet_index(df, data_version)
+    actor_list = facets["actor_list"]
+    genre_list = facets["genre_list"]
+    unique_ips = facets["ip_list"]
 
     # ===== 통합 검색 필터 영역 (4단 분할로 좌측 몰기) =====
     col_filter1, col_filter2, col_filter3, col_dummy = st.columns([1, 1, 1, 1.5])
@@ -999,7 +2844,7 @@ def render_actor_genre_list(df: pd.DataFrame):
     with col_filter3:
         selected_ips = st.multiselect("📌 작품명 필터", options=unique_ips, default=[])
     with col_dummy:
-        pass # 우측 여백을 위한 투명(더미) 공간
+        search_query = st.text_input("🔍 검색", placeholder="작품명, 배우, 분석주제 (일부만 입력해도 검색)").strip()
 
     # ===== 필터와 리스트 사이의 명확한 구분선 =====
     st.markdown("<hr style='margin: 30px 0; border: none; border-top: 1px solid #eaeaea;'>", unsafe_allow_html=True)
@@ -1008,6 +2853,14 @@ def render_actor_genre_list(df: pd.DataFrame):
     if selected_actors and selected_genres:
         st.warning("⚠️ 배우 필터와 분석주제 필터는 동시에 사용할 수 없습니다. 한 쪽 필터를 비워주세요.")
 
+    # ===== 필터·검색어가 바뀌면 리스트를 첫 페이지부터 다시 표시 =====
+    signature = (tuple(selected_actors), tuple(selected_genres), tuple(selected_ips), search_query)
+
+    # ===== 검색어가 있으면 관련도 순으로 정렬된 일치 행만 표시 =====
+    matched_rows = []
+    if search_query:
+        matched_rows = search_rows("archive", df, ["actor_stable_id", "genre_stable_id"], ["ip", "cast_clean", "genre_title"], search_query)
+
     # ===== 분석 리스트 영역 (좌우 2단 컬럼 분리) =====
     col_actor, col_genre = st.columns(2)
 
@@ -1015,14 +2868,11 @@ def render_actor_genre_list(df: pd.DataFrame):
     with col_actor:
         # 장르(분석주제) 필터가 비어있을 때만 렌더링
         if not selected_genres: 
-            actor_df = df[df["actor_range"] != ""].copy()
-            
-            # 필터 로직
-            if selected_actors:
-                mask = actor_df["cast"].apply(lambda x: any(k.lower() in str(x).lower() for k in selected_actors))
-                actor_df = actor_df[mask]
-            if selected_ips:
-                actor_df = actor_df[actor_df["ip"].isin(selected_ips)]
+            # 필터 로직 (색인의 행 집합 교집합)
+            actor_rows = filter_rows_by_facets(facets, "actor_rows", "cast_lower", selected_actors, selected_ips)
+            if search_query:
+                allowed = set(actor_rows)
+                actor_rows = [p for p in matched_rows if p in allowed]
 
             # 배경을 감싸기 위해 전체 HTML을 리스트로 모음 (연한 보라색 배경 추가)
             actor_html = [
@@ -1030,45 +2880,26 @@ def render_actor_genre_list(df: pd.DataFrame):
                 '<div style="background-color: #f5f3ff; padding: 12px 20px; border-radius: 8px; font-weight: 700; font-size: 16px; margin-bottom: 16px; border-left: 5px solid #8b5cf6; color: #4c1d95;">👤 캐스팅 분석</div>'
             ]
 
-            if actor_df.empty:
+            visible = get_list_visible_count("actor", signature)
+            if not actor_rows:
                 actor_html.append('<div style="padding: 16px; background-color: #ffffff; border-radius: 8px; border: 1px solid #eaeaea; color: #666; font-size: 14px;">조건에 맞는 캐스팅 분석 페이지가 없습니다.</div>')
             else:
-                for _, row in actor_df.iterrows():
-                    link = f"?view=actor_detail&id={row.get('actor_stable_id') or row['row_id']}"
-                    ip = row["ip"]
-                    cast = row["cast_clean"] or row["cast"]
-                    date = row["date"]
-                    air = row["air"]
-                    
-                    date_str = date if date else "미상"
-                    air_str = air if air else "미상"
-                    meta = f"분석시점 : {date_str} / IP방영시점 : {air_str}"
-                    cast_text = cast if cast else "배우 정보 없음"
-                    title_display = f"{cast_text} ({ip})"
-
-                    # 들여쓰기로 인한 코드블록 인식 오류를 막기 위해 한 줄 문자열 연결 방식 사용
-                    actor_html.append(
-                        f'<a href="{link}" target="_self" class="analysis-card" style="margin-bottom: 12px;">'
-                        f'<div class="analysis-title-row"><div class="analysis-ip">{title_display}</div>'
-                        f'<div class="analysis-label">캐스팅 분석</div></div>'
-                        f'<div class="analysis-meta">{meta}</div>'
-                        f'<div class="analysis-sub">작품: {ip}</div></a>'
-                    )
+                # 행마다 미리 만들어 둔 카드 조각을 이어 붙이기만 함
+                fragments = build_card_fragments(df, data_version, "actor")
+                actor_html.extend(fragments[pos] for pos in actor_rows[:visible])
             actor_html.append('</div>')
             st.markdown("".join(actor_html), unsafe_allow_html=True)
+            render_list_more_button("actor", signature, visible, len(actor_rows))
 
     # ===== 3. 장르 분석 리스트 영역 (우측) =====
     with col_genre:
         # 배우 필터가 비어있을 때만 렌더링
         if not selected_actors: 
-            genre_df = df[df["genre_range"] != ""].copy()
-            
-            # 필터 로직
-            if selected_genres:
-                mask = genre_df["genre_title"].apply(lambda x: any(k.lower() in str(x).lower() for k in selected_genres))
-                genre_df = genre_df[mask]
-            if selected_ips:
-                genre_df = genre_df[genre_df["ip"].isin(selected_ips)]
+            # 필터 로직 (색인의 행 집합 교집합)
+            genre_rows = filter_rows_by_facets(facets, "genre_rows", "genre_lower", selected_genres, selected_ips)
+            if search_query:
+                allowed = set(genre_rows)
+                genre_rows = [p for p in matched_rows if p in allowed]
 
             # 배경을 감싸기 위해 전체 HTML을 리스트로 모음 (연한 파란색 배경 추가)
             genre_html = [
@@ -1076,31 +2907,16 @@ def render_actor_genre_list(df: pd.DataFrame):
                 '<div style="background-color: #eff6ff; padding: 12px 20px; border-radius: 8px; font-weight: 700; font-size: 16px; margin-bottom: 16px; border-left: 5px solid #4a90e2; color: #1e3a8a;">🏷️ 장르 분석</div>'
             ]
 
-            if genre_df.empty:
+            visible = get_list_visible_count("genre", signature)
+            if not genre_rows:
                 genre_html.append('<div style="padding: 16px; background-color: #ffffff; border-radius: 8px; border: 1px solid #eaeaea; color: #666; font-size: 14px;">조건에 맞는 장르 분석 페이지가 없습니다.</div>')
             else:
-                for _, row in genre_df.iterrows():
-                    link = f"?view=genre_detail&id={row.get('genre_stable_id') or row['row_id']}"
-                    ip = row["ip"]
-                    title = row["genre_title"] or "장르 분석"
-                    date = row["date"]
-                    air = row["air"]
-
-                    date_str = date if date else "미상"
-                    air_str = air if air else "미상"
-                    meta = f"분석시점 : {date_str} / IP방영시점 : {air_str}"
-                    title_display = f"{title} ({ip})"
-
-                    # 들여쓰기로 인한 코드블록 인식 오류를 막기 위해 한 줄 문자열 연결 방식 사용
-                    genre_html.append(
-                        f'<a href="{link}" target="_self" class="analysis-card" style="margin-bottom: 12px;">'
-                        f'<div class="analysis-title-row"><div class="analysis-ip">{title_display}</div>'
-                        f'<div class="analysis-label">장르 분석</div></div>'
-                        f'<div class="analysis-meta">{meta}</div>'
-                        f'<div class="analysis-sub">작품: {ip}</div></a>'
-                    )
+                # 행마다 미리 만들어 둔 카드 조각을 이어 붙이기만 함
+                fragments = build_card_fragments(df, data_version, "genre")
+                genre_html.extend(fragments[pos] for pos in genre_rows[:visible])
             genre_html.append('</div>')
             st.markdown("".join(genre_html), unsafe_allow_html=True)
+            render_list_more_button("genre", signature, visible, len(genre_rows))
 
 
 # ─────────────────────────────────────────────────────────────
@@ -1114,6 +2930,7 @@ def main():
     if VIEW == "monthly":
         df_monthly = load_monthly_df()
         render_monthly_list(df_monthly)
+        ensure_report_indexer()
     elif VIEW == "monthly_detail" and ROW_ID is not None:
         df_monthly = load_monthly_df()
         render_monthly_detail(df_monthly, ROW_ID)
@@ -1125,6 +2942,7 @@ def main():
 
         if VIEW == "actor_genre":
             render_actor_genre_list(df)
+            ensure_report_indexer()
         elif VIEW == "actor_detail" and ROW_ID is not None:
             render_actor_detail(df, ROW_ID)
         elif VIEW == "genre_detail" and ROW_ID is not None:
@@ -0,0 +1,122 @@
+"""PDF 페이지 래스터화 워커.
+
+프로세스 풀(spawn)에서 실행되므로 streamlit에 의존하지 않는 순수 함수만 둡니다.
+각 워커는 디스크에 저장된 PDF 파일 경로를 직접 열어 필요한 페이지만 렌더링합니다.
+"""
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import fitz
+
+# 워커 프로세스별로 마지막에 연 문서를 재사용 (같은 리포트의 여러 페이지를 연속으로 받는 경우가 대부분)
+# 스레드 간 동기화가 없으므로 단일 스레드인 워커 프로세스 전용. 서버 프로세스에서는 keep_open=False로 호출
+_open_docs: Dict[Tuple[str, int, int], "fitz.Document"] = {}
+
+
+def _file_key(pdf_path: str) -> Tuple[str, int, int]:
+    # 같은 경로에 파일을 다시 받으면(os.replace) inode가 바뀜. mtime은 LRU 캐시가 사용할 때마다 갱신하므로 쓰지 않음
+    # (열어 둔 문서가 이전 파일을 붙잡고 있어 그 inode가 새 파일에 재사용되지 않음)
+    info = os.stat(pdf_path)
+    return (pdf_path, info.st_ino, info.st_size)
+
+
+def _open_document(pdf_path: str) -> "fitz.Document":
+    key = _file_key(pdf_path)
+    doc = _open_docs.get(key)
+    if doc is None:
+        for old in _open_docs.values():
+            old.close()
+        _open_docs.clear()
+        doc = fitz.open(pdf_path)
+        _open_docs[key] = doc
+    return doc
+
+
+def encode_pixmap(pix: "fitz.Pixmap", fmt: str, quality: int) -> bytes:
+    if fmt == "png":
+        return pix.tobytes("png")
+    # JPEG / WebP는 Pillow 인코더 사용 (사진이 많은 페이지에서 PNG 대비 용량이 크게 줄어듦)
+    return pix.pil_tobytes(format=fmt.upper(), quality=quality, optimize=True)
+
+
+def count_pages(pdf_path: str) -> int:
+    """서버 프로세스(세션 스레드)에서 호출하므로 문서 캐시를 쓰지 않고 열었다가 바로 닫습니다."""
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+
+def rasterize_page(pdf_path: str, page_num: int, tiers: Tuple, keep_open: bool = True) -> dict:
+    """한 페이지를 tiers의 (이름, 배율, 포맷, 품질)마다 인코딩합니다.
+    keep_open=False면 문서 캐시를 거치지 않습니다. (워커가 아닌 서버 프로세스에서 직접 렌더링할 때)
+
+    반환값: {"page": 번호, "width": pt, "height": pt, "tiers": {티어명: (bytes, 포맷, 픽셀 너비)}}
+    """
+    if not keep_open:
+        with fitz.open(pdf_path) as doc:
+            return _rasterize(doc.load_page(page_num), page_num, tiers)
+    doc = _open_document(pdf_path)
+    return _rasterize(doc.load_page(page_num), page_num, tiers)
+
+
+def _rasterize(page: "fitz.Page", page_num: int, tiers: Tuple) -> dict:
+    result = {"page": page_num, "width": page.rect.width, "height": page.rect.height, "tiers": {}}
+    for tier, scale, fmt, quality in tiers:
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        result["tiers"][tier] = (encode_pixmap(pix, fmt, quality), fmt, pix.width)
+    return result
+
+
+def extract_page_texts(pdf_path: str) -> List[str]:
+    """페이지별 본문 텍스트 (전문 검색 색인용). 한 번에 모두 읽고 색인용 임시 파일은 곧 지워지므로 캐시하지 않습니다."""
+    with fitz.open(pdf_path) as doc:
+        return [page.get_text("text") for page in doc]
+
+
+# 선형화 사전은 파일 첫 1024바이트 안에 있는 첫 번째 객체여야 함 (PDF 1.7 부록 F)
+LINEARIZATION_SCAN_BYTES = 1024
+_OBJECT_HEADER = re.compile(rb"\d+\s+\d+\s+obj\s*")
+
+
+def read_linearization(head: bytes) -> Optional[dict]:
+    """파일 앞부분(최대 LINEARIZATION_SCAN_BYTES)에서 선형화 사전을 읽습니다.
+
+    반환값: 아직 판단할 만큼 받지 못했으면 None, 선형화 PDF가 아니면 {},
+    선형화 PDF면 {"E": 첫 페이지 구간이 끝나는 바이트 위치, "L": 파일 길이}"""
+    head = head[:LINEARIZATION_SCAN_BYTES]
+    complete = len(head) >= LINEARIZATION_SCAN_BYTES
+    m = _OBJECT_HEADER.search(head)
+    if m is None:
+        return {} if complete else None
+    if not head.startswith(b"<<", m.end()):
+        return {} if len(head) > m.end() + 1 else None
+    close = head.find(b">>", m.end())
+    if close < 0:
+        return {} if complete else None
+    body = head[m.end():close]
+    if b"/Linearized" not in body:
+        return {}
+    first_page_end = re.search(rb"/E\s+(\d+)", body)
+    length = re.search(rb"/L\s+(\d+)", body)
+    if first_page_end is None or length is None:
+        return {}
+    return {"E": int(first_page_end.group(1)), "L": int(length.group(1))}
+
+
+def rasterize_partial_first_page(pdf_path: str, first_page_end: int, tiers: Tuple) -> Optional[dict]:
+    """다운로드 중인 선형화 PDF의 첫 페이지 구간(앞에서부터 first_page_end 바이트)만으로 첫 페이지를 렌더링합니다.
+
+    선형화(Fast Web View) PDF는 첫 페이지에 필요한 객체가 선형화 사전의 /E 위치 앞에 모여 있어
+    나머지를 받기 전에도 그릴 수 있습니다. 호출 측이 그만큼 받았는지 read_linearization으로 확인한 뒤 호출합니다.
+    실패하면 None."""
+    with open(pdf_path, "rb") as f:
+        data = f.read(first_page_end)
+    if len(data) < first_page_end:
+        return None
+    try:
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            if len(doc) == 0:
+                return None
+            return _rasterize(doc.load_page(0), 0, tiers)
+    except Exception:
+        return None
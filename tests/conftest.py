@@ -0,0 +1,119 @@
+import os
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def dpaa(tmp_path_factory):
+    """DPAA 모듈 (스트림릿 bare 모드). Secrets는 임시 디렉터리의 .streamlit/secrets.toml로 지정합니다."""
+    workdir = tmp_path_factory.mktemp("app")
+    (workdir / ".streamlit").mkdir()
+    (workdir / ".streamlit" / "secrets.toml").write_text(
+        f'ARCHIVE_SHEET_URL = ""\nCACHE_DIR = "{workdir / "cache"}"\nREPORT_INDEX_ENABLED = false\n',
+        encoding="utf-8",
+    )
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import DPAA
+    finally:
+        os.chdir(cwd)
+    return DPAA
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """페이지마다 번호 텍스트가 있는 PDF를 만들어 경로를 반환합니다."""
+    import fitz
+
+    def _make(pages: int = 3, name: str = "doc.pdf") -> Path:
+        doc = fitz.open()
+        for i in range(pages):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {i + 1}", fontsize=24)
+        path = tmp_path / name
+        doc.save(path)
+        doc.close()
+        return path
+
+    return _make
+
+
+def _pdf_object(num: int, body: bytes) -> bytes:
+    return b"%d 0 obj\n" % num + body + b"\nendobj\n"
+
+
+def _text_stream(text: str) -> bytes:
+    content = f"BT /F1 24 Tf 72 720 Td ({text}) Tj ET".encode()
+    return b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+
+
+def build_linearized_pdf(pages: int = 3, padding: int = 0) -> Tuple[bytes, int]:
+    """첫 페이지 객체가 /E 앞에 모인 선형화 PDF를 직접 만들어 (파일 내용, /E)를 반환합니다.
+    (PyMuPDF는 선형화 저장을 지원하지 않음) padding은 나머지 페이지 구간에 덧붙일 바이트 수입니다."""
+    page = b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+    # 나머지 페이지 구간: 객체 1..2(pages-1), 첫 페이지 구간: 선형화 사전 + 카탈로그·페이지 트리·첫 페이지·글꼴·힌트 스트림
+    lin = 2 * (pages - 1) + 1
+    catalog, tree, first, first_content, font, hint = range(lin + 1, lin + 7)
+    kids = b" ".join(b"%d 0 R" % n for n in [first] + [2 * i + 1 for i in range(pages - 1)])
+    first_objects = [
+        (catalog, b"<< /Type /Catalog /Pages %d 0 R >>" % tree),
+        (tree, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)),
+        (first, page % (tree, font, first_content)),
+        (first_content, _text_stream("Page 1")),
+        (font, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"),
+        (hint, b"<< /Length 0 >>\nstream\n\nendstream"),
+    ]
+    rest_objects = []
+    for i in range(pages - 1):
+        rest_objects.append((2 * i + 1, page % (tree, font, 2 * i + 2)))
+        rest_objects.append((2 * i + 2, _text_stream(f"Page {i + 2}")))
+
+    def assemble(length: int, first_page_end: int, hint_offset: int, main_xref: int):
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = {lin: len(out)}
+        out += _pdf_object(lin, b"<< /Linearized 1 /L %010d /H [%010d 0000000040] /O %d /E %010d /N %d /T %010d >>" % (
+            length, hint_offset, first, first_page_end, pages, main_xref))
+        first_xref = len(out)
+        count = hint - lin + 1
+        entries_at = len(out) + len(b"xref\n%d %d\n" % (lin, count))
+        out += b"xref\n%d %d\n" % (lin, count) + b"0" * 20 * count
+        out += b"trailer\n<< /Size %d /Root %d 0 R /Prev %010d >>\nstartxref\n0\n%%%%EOF\n" % (hint + 1, catalog, main_xref)
+        for num, body in first_objects:
+            offsets[num] = len(out)
+            out += _pdf_object(num, body)
+        end = len(out)
+        if padding:
+            out += b"%" + b"x" * padding + b"\n"  # 주석: 나머지 구간을 키워 다운로드 중인 상태를 흉내 냄
+        for num, body in rest_objects:
+            offsets[num] = len(out)
+            out += _pdf_object(num, body)
+        main = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \r\n" % lin
+        out += b"".join(b"%010d 00000 n \r\n" % offsets[n] for n in range(1, lin))
+        out += b"trailer\n<< /Size %d >>\nstartxref\n%d\n%%%%EOF\n" % (lin, first_xref)
+        out[entries_at:entries_at + 20 * count] = b"".join(b"%010d 00000 n \r\n" % offsets[n] for n in range(lin, hint + 1))
+        return bytes(out), end, offsets[hint], main
+
+    data, end, hint_offset, main = assemble(0, 0, 0, 0)
+    data, end, hint_offset, main = assemble(len(data), end, hint_offset, main)
+    return data, end
+
+
+@pytest.fixture
+def make_linearized_pdf(tmp_path):
+    """선형화 PDF 파일을 만들어 (경로, /E)를 반환합니다."""
+
+    def _make(pages: int = 3, padding: int = 0, name: str = "linear.pdf") -> Tuple[Path, int]:
+        data, first_page_end = build_linearized_pdf(pages, padding)
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path, first_page_end
+
+    return _make
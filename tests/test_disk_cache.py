@@ -0,0 +1,65 @@
+import os
+import time
+
+
+def _write(path, size, age):
+    path.write_bytes(b"x" * size)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_evicts_least_recently_used_first(dpaa, tmp_path):
+    old = _write(tmp_path / "old.pdf", 100, age=300)
+    new = _write(tmp_path / "new.pdf", 100, age=10)
+    assert dpaa.evict_disk_cache(tmp_path, 150) == 1
+    assert not old.exists() and new.exists()
+
+
+def test_keep_survives_even_if_oldest(dpaa, tmp_path):
+    keep = _write(tmp_path / "keep.pdf", 100, age=300)
+    other = _write(tmp_path / "other.pdf", 100, age=10)
+    assert dpaa.evict_disk_cache(tmp_path, 150, keep=keep) == 1
+    assert keep.exists() and not other.exists()
+
+
+def test_stale_partial_downloads_are_evicted_and_counted(dpaa, tmp_path):
+    stale = _write(tmp_path / "a.pdf.part.tmp", 100, age=dpaa.DISK_CACHE_STALE_TMP_SECONDS + 60)
+    active = _write(tmp_path / "b.pdf.part.tmp", 100, age=5)
+    cached = _write(tmp_path / "c.pdf", 100, age=60)
+    # 완성 파일만 세면 100바이트로 상한(250) 이내지만, 임시 파일까지 합치면 300바이트
+    assert dpaa.evict_disk_cache(tmp_path, 250) == 1
+    assert not stale.exists()
+    assert active.exists() and cached.exists()
+
+
+def test_active_partial_download_is_never_evicted(dpaa, tmp_path):
+    active = _write(tmp_path / "b.pdf.part.tmp", 300, age=5)
+    cached = _write(tmp_path / "c.pdf", 100, age=60)
+    assert dpaa.evict_disk_cache(tmp_path, 250) == 1
+    assert active.exists() and not cached.exists()
+
+
+def test_writes_rescan_only_past_limit_or_interval(dpaa, tmp_path, monkeypatch):
+    now = {"t": 1000.0}
+    scans = []
+    scan = dpaa._evict_disk_cache
+    monkeypatch.setattr(dpaa.time, "monotonic", lambda: now["t"])
+    monkeypatch.setattr(dpaa, "_evict_disk_cache", lambda *args: scans.append(args[0]) or scan(*args))
+    dpaa.get_disk_cache_usage.clear()
+
+    dpaa.maybe_evict_disk_cache(tmp_path, 250, 100)  # 처음에는 디렉터리를 한 번 훑어 기준 용량을 잡음
+    assert len(scans) == 1
+    _write(tmp_path / "a.pdf", 100, age=30)
+    dpaa.maybe_evict_disk_cache(tmp_path, 250, 100)
+    _write(tmp_path / "b.pdf", 100, age=20)
+    dpaa.maybe_evict_disk_cache(tmp_path, 250, 100)
+    assert len(scans) == 1  # 추정 용량 200바이트: 상한 이내라 다시 훑지 않음
+    _write(tmp_path / "c.pdf", 100, age=10)
+    assert dpaa.maybe_evict_disk_cache(tmp_path, 250, 100) == 1  # 300바이트로 상한 초과 → 정리
+    assert len(scans) == 2 and not (tmp_path / "a.pdf").exists()
+
+    now["t"] += dpaa.DISK_CACHE_RESCAN_SECONDS  # 추정에 잡히지 않은 기록도 주기적으로 반영
+    dpaa.maybe_evict_disk_cache(tmp_path, 250, 0)
+    assert len(scans) == 3
+    dpaa.get_disk_cache_usage.clear()
@@ -0,0 +1,140 @@
+import threading
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+
+@pytest.fixture
+def clock(dpaa, monkeypatch):
+    """time.monotonic / time.sleep을 가짜 시계로 바꿉니다. sleep은 기다린 시간만큼 시계를 진행시킵니다."""
+    state = {"now": 100.0, "sleeps": []}
+
+    def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(dpaa.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(dpaa.time, "sleep", sleep)
+    return state
+
+
+def _limiters(rate, capacity, now):
+    return {"test": {"lock": threading.Lock(), "rate": rate, "capacity": capacity, "tokens": float(capacity), "updated": now}}
+
+
+def test_acquire_api_token_spends_burst_then_waits_for_refill(dpaa, clock):
+    limiters = _limiters(rate=2.0, capacity=2, now=clock["now"])
+    dpaa.acquire_api_token("test", limiters)
+    dpaa.acquire_api_token("test", limiters)
+    assert clock["sleeps"] == []
+    dpaa.acquire_api_token("test", limiters)
+    assert clock["sleeps"] == [pytest.approx(0.5)]
+
+
+def test_acquire_api_token_refill_is_capped_at_capacity(dpaa, clock):
+    limiters = _limiters(rate=1.0, capacity=2, now=clock["now"])
+    clock["now"] += 60  # 오래 쉬어도 순간 최대치(2)까지만 쌓임
+    for _ in range(3):
+        dpaa.acquire_api_token("test", limiters)
+    assert clock["sleeps"] == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize("value", [0, -1, "abc", float("nan")])
+def test_invalid_qps_setting_falls_back_to_default(dpaa, monkeypatch, value):
+    monkeypatch.setattr(dpaa.st, "secrets", {"TEST_QPS": value})
+    assert dpaa.read_qps_setting("TEST_QPS", 8) == 8.0
+
+
+def test_valid_qps_setting(dpaa, monkeypatch):
+    monkeypatch.setattr(dpaa.st, "secrets", {"TEST_QPS": "2.5"})
+    assert dpaa.read_qps_setting("TEST_QPS", 8) == 2.5
+
+
+def _http_error(status):
+    return HttpError(httplib2.Response({"status": status}), b"{}")
+
+
+class _FakeBatch:
+    def __init__(self, callback, outcomes):
+        self.callback = callback
+        self.outcomes = outcomes
+        self.ids = []
+
+    def add(self, request, request_id):
+        self.ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.ids:
+            outcome = self.outcomes[request_id].pop(0)
+            if isinstance(outcome, Exception):
+                self.callback(request_id, None, outcome)
+            else:
+                self.callback(request_id, outcome, None)
+
+
+class _FakeDrive:
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(callback, self.outcomes)
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields):
+        return None
+
+
+def test_batch_retries_transient_item_errors(dpaa, clock):
+    service = _FakeDrive({
+        "a": [{"thumbnailLink": "https://t/a=s220", "modifiedTime": "m1"}],
+        "b": [_http_error(503), {"thumbnailLink": "https://t/b=s220", "modifiedTime": "m2"}],
+    })
+    assert dpaa._fetch_drive_thumbnail_chunk(service, ("a", "b")) == {
+        "a": ("https://t/a=s1000", "m1"),
+        "b": ("https://t/b=s1000", "m2"),
+    }
+
+
+def test_batch_item_failure_is_not_cached_as_missing(dpaa, clock):
+    service = _FakeDrive({
+        "a": [{"thumbnailLink": "https://t/a=s220", "modifiedTime": "m1"}],
+        "b": [_http_error(404)],
+    })
+    with pytest.raises(dpaa.IncompleteResult) as excinfo:
+        dpaa._fetch_drive_thumbnail_chunk(service, ("a", "b"))
+    assert excinfo.value.value == {"a": ("https://t/a=s1000", "m1")}
+
+
+class _FakeSlides:
+    def __init__(self):
+        self.calls = 0
+
+    def presentations(self):
+        return self
+
+    def get(self, presentationId, fields):
+        self.calls += 1
+        return self
+
+    def execute(self):
+        return {"slides": [{"objectId": f"p{self.calls}"}]}
+
+
+def test_unversioned_page_ids_use_short_lived_cache(dpaa, monkeypatch):
+    slides = _FakeSlides()
+    monkeypatch.setattr(dpaa, "get_slides_service", lambda: slides)
+    dpaa._fetch_presentation_page_ids.clear()
+    dpaa._fetch_unversioned_presentation_page_ids.clear()
+
+    assert dpaa.get_presentation_page_ids("deck", "r1") == ["p1"]
+    assert dpaa.get_presentation_page_ids("deck", "r1") == ["p1"]
+    assert dpaa.get_presentation_page_ids("deck") == ["p2"]
+    assert slides.calls == 2
+    # 리비전 없는 결과는 1시간 캐시에 남지 않음 → 짧은 캐시가 만료되면 다시 조회
+    dpaa._fetch_unversioned_presentation_page_ids.clear()
+    assert dpaa.get_presentation_page_ids("deck") == ["p3"]
+    dpaa._fetch_presentation_page_ids.clear()
+    dpaa._fetch_unversioned_presentation_page_ids.clear()
@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def find(dpaa, tmp_path, monkeypatch):
+    """별칭 기록을 테스트마다 새 디렉터리에 두고 find_row_by_identifier를 반환합니다."""
+    monkeypatch.setattr(dpaa, "CACHE_DIR", tmp_path)
+    dpaa.build_identifier_index.clear()
+    yield lambda df, identifier: dpaa.find_row_by_identifier(df, identifier, "stable_id")
+    dpaa.build_identifier_index.clear()
+
+
+def _frame(dpaa, stable_ids):
+    df = pd.DataFrame({"stable_id": stable_ids})
+    df["row_id"] = "monthly_" + df.index.astype(str)
+    df.attrs["data_version"] = dpaa.compute_data_version(df)
+    return df
+
+
+def _found(df):
+    return df["stable_id"].tolist()
+
+
+def test_lookup_by_stable_id_and_row_id(dpaa, find):
+    df = _frame(dpaa, ["a", "b", "c"])
+    assert _found(find(df, "b")) == ["b"]
+    assert _found(find(df, "monthly_2")) == ["c"]
+    assert find(df, "missing").empty
+
+
+def test_old_row_id_follows_first_seen_report_after_reorder(dpaa, find):
+    assert _found(find(_frame(dpaa, ["a", "b", "c"]), "monthly_0")) == ["a"]
+    # 맨 앞에 새 리포트가 들어와 row_id가 밀림 → 예전 링크는 여전히 a
+    reordered = _frame(dpaa, ["new", "a", "b", "c"])
+    assert _found(find(reordered, "monthly_0")) == ["a"]
+    assert _found(find(reordered, "monthly_1")) == ["b"]
+    # 두 번째 순서 변경 뒤에도 처음 기록이 유지됨
+    assert _found(find(_frame(dpaa, ["x", "y", "new", "a", "b", "c"]), "monthly_0")) == ["a"]
+    # 처음 보는 row_id는 현재 위치로 연결
+    assert _found(find(reordered, "monthly_3")) == ["c"]
+
+
+def test_deleted_report_does_not_open_another_row(dpaa, find):
+    find(_frame(dpaa, ["a", "b"]), "a")
+    after_delete = _frame(dpaa, ["b", "c"])
+    assert find(after_delete, "monthly_0").empty
+    assert find(after_delete, "a").empty
+    assert _found(find(after_delete, "monthly_1")) == ["b"]
+
+
+def test_edited_report_keeps_old_links(dpaa, find):
+    find(_frame(dpaa, ["a", "b"]), "a")
+    edited = _frame(dpaa, ["a-fixed", "b"])
+    assert _found(find(edited, "a")) == ["a-fixed"]
+    assert _found(find(edited, "monthly_0")) == ["a-fixed"]
+    aliases = dpaa._load_id_aliases("stable_id")
+    assert aliases["renamed"] == {"a": "a-fixed"}
+    assert aliases["row_ids"] == {"monthly_0": "a", "monthly_1": "b"}
+    # 두 번 수정되어도 처음 id에서 따라감
+    assert _found(find(_frame(dpaa, ["a-fixed-2", "b"]), "a")) == ["a-fixed-2"]
+
+
+def test_reads_legacy_flat_alias_file(dpaa, find, tmp_path):
+    path = dpaa._id_alias_path("stable_id")
+    path.parent.mkdir(parents=True)
+    path.write_text('{"monthly_0": "b"}', encoding="utf-8")
+    assert _found(find(_frame(dpaa, ["a", "b"]), "monthly_0")) == ["b"]
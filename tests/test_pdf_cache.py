@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def downloads(dpaa, tmp_path, monkeypatch):
+    """다운로드 횟수를 세는 가짜 download_drive_pdf"""
+    calls = []
+
+    def fake_download(file_id, dest, revision="", export=False, progress=None):
+        calls.append((file_id, revision))
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(b"%PDF-1.4 " + str(len(calls)).encode())
+        return True
+
+    monkeypatch.setattr(dpaa, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(dpaa, "download_drive_pdf", fake_download)
+    dpaa.get_unversioned_pdf_downloads().clear()
+    yield calls
+    dpaa.get_unversioned_pdf_downloads().clear()
+
+
+def test_revisioned_pdf_is_downloaded_once(dpaa, downloads):
+    first = dpaa.get_pdf_source_path("f1", "rev1")
+    assert dpaa.get_pdf_source_path("f1", "rev1") == first
+    assert downloads == [("f1", "rev1")]
+
+
+def test_unversioned_pdf_is_reused_within_ttl(dpaa, downloads, monkeypatch):
+    first = dpaa.get_pdf_source_path("f1", "")
+    assert dpaa.get_pdf_source_path("f1", "") == first
+    assert len(downloads) == 1
+
+    # 받은 지 TTL이 지나면 다시 받음 (LRU 사용 시각이 아니라 받은 시각 기준)
+    now = time.time()
+    monkeypatch.setattr(dpaa.time, "time", lambda: now + dpaa.PDF_UNVERSIONED_TTL_SECONDS + 1)
+    assert dpaa.get_pdf_source_path("f1", "") == first
+    assert len(downloads) == 2
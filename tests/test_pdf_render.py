@@ -0,0 +1,62 @@
+import pdf_render
+
+TIERS = (("preview", 0.3, "jpeg", 40),)
+
+
+def test_count_pages_does_not_keep_document_open(make_pdf):
+    pdf_render._open_docs.clear()
+    assert pdf_render.count_pages(str(make_pdf(pages=4))) == 4
+    assert pdf_render._open_docs == {}
+
+
+def test_rasterize_page_without_document_cache(make_pdf):
+    pdf_render._open_docs.clear()
+    result = pdf_render.rasterize_page(str(make_pdf()), 1, TIERS, keep_open=False)
+    assert result["page"] == 1
+    data, fmt, width = result["tiers"]["preview"]
+    assert fmt == "jpeg" and data[:2] == b"\xff\xd8" and width > 0
+    assert pdf_render._open_docs == {}
+
+
+def test_rasterize_page_reuses_worker_document(make_pdf):
+    pdf_render._open_docs.clear()
+    path = str(make_pdf())
+    pdf_render.rasterize_page(path, 0, TIERS)
+    doc = next(iter(pdf_render._open_docs.values()))
+    pdf_render.rasterize_page(path, 2, TIERS)
+    assert next(iter(pdf_render._open_docs.values())) is doc
+
+
+def test_worker_document_reopened_after_file_is_replaced(make_pdf):
+    pdf_render._open_docs.clear()
+    path = make_pdf(pages=2, name="src.pdf")
+    pdf_render.rasterize_page(str(path), 1, TIERS)
+    # 같은 경로에 새 버전을 받은 경우 (다운로드는 임시 파일을 os.replace로 교체)
+    newer = make_pdf(pages=5, name="newer.pdf")
+    newer.replace(path)
+    assert pdf_render.rasterize_page(str(path), 4, TIERS)["page"] == 4
+    assert len(pdf_render._open_docs) == 1
+    assert len(next(iter(pdf_render._open_docs.values()))) == 5
+
+
+def test_read_linearization(make_pdf, make_linearized_pdf):
+    path, first_page_end = make_linearized_pdf(pages=3)
+    data = path.read_bytes()
+    assert pdf_render.read_linearization(data) == {"E": first_page_end, "L": len(data)}
+    # 선형화 사전을 다 받기 전에는 판단하지 않음
+    assert pdf_render.read_linearization(data[:40]) is None
+    assert pdf_render.read_linearization(make_pdf().read_bytes()) == {}
+
+
+def test_partial_first_page_from_truncated_linearized_pdf(make_linearized_pdf, tmp_path):
+    path, first_page_end = make_linearized_pdf(pages=3, padding=200_000)
+    partial = tmp_path / "linear.pdf.part.tmp"
+    partial.write_bytes(path.read_bytes()[:first_page_end + 1000])
+
+    result = pdf_render.rasterize_partial_first_page(str(partial), first_page_end, TIERS)
+    assert result["page"] == 0 and result["width"] == 612
+    assert result["tiers"]["preview"][0][:2] == b"\xff\xd8"
+
+    # 첫 페이지 구간을 다 받지 못했으면 그리지 않음
+    partial.write_bytes(path.read_bytes()[:first_page_end - 1])
+    assert pdf_render.rasterize_partial_first_page(str(partial), first_page_end, TIERS) is None
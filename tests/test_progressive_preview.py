@@ -0,0 +1,111 @@
+from concurrent.futures import Future
+from unittest import mock
+
+import pytest
+
+
+class _InlinePool:
+    """제출 즉시 실행하는 렌더링 풀"""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        self.calls.append(args)
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def preview(dpaa, monkeypatch):
+    pool = _InlinePool()
+    monkeypatch.setattr(dpaa, "get_render_pool", lambda: pool)
+    monkeypatch.setattr(dpaa, "store_pdf_page_assets", mock.Mock(side_effect=AssertionError("임시 미리보기는 저장하지 않음")))
+    page_slot = mock.MagicMock()
+    callback = dpaa.make_progressive_preview("file", mock.MagicMock(), page_slot)
+    return callback, pool, page_slot
+
+
+def test_renders_once_after_first_page_section_arrives(dpaa, preview, make_linearized_pdf, tmp_path):
+    callback, pool, page_slot = preview
+    path, first_page_end = make_linearized_pdf(pages=3, padding=200_000)
+    data = path.read_bytes()
+    partial = tmp_path / "file.part.tmp"
+    small_chunks = []
+    for done in (200, first_page_end - 10, first_page_end + 50_000, len(data)):
+        partial.write_bytes(data[:done])
+        small_chunks.append(callback(done, len(data), str(partial)))
+        if done > first_page_end:
+            # 첫 페이지 구간이 도착한 바로 그 청크에서 미리보기를 그림 (다음 청크를 기다리지 않음)
+            page_slot.container.assert_called_once()
+    # /E 이전에는 제출하지 않고, 이후에는 한 번만 제출
+    assert pool.calls == [(str(partial), first_page_end, dpaa.PDF_PREVIEW_TIERS)]
+    page_slot.container.assert_called_once()
+    # 미리보기 여부가 정해질 때까지만 작은 청크를 요청
+    assert small_chunks == [True, True, False, False]
+
+
+def test_stops_after_not_linearized(dpaa, preview, make_pdf, tmp_path):
+    callback, pool, page_slot = preview
+    data = make_pdf(pages=3).read_bytes()
+    partial = tmp_path / "file.part.tmp"
+    partial.write_bytes(data)
+    with mock.patch("pdf_render.read_linearization", wraps=__import__("pdf_render").read_linearization) as read:
+        for done in (2000, 4000, len(data)):
+            callback(done, len(data), str(partial))
+    assert read.call_count == 1
+    assert pool.calls == []
+    page_slot.container.assert_not_called()
+
+
+def test_no_preview_when_disabled(dpaa, monkeypatch, make_linearized_pdf):
+    pool = _InlinePool()
+    monkeypatch.setattr(dpaa, "get_render_pool", lambda: pool)
+    path, first_page_end = make_linearized_pdf()
+    callback = dpaa.make_progressive_preview("file", mock.MagicMock(), mock.MagicMock(), show_first_page=False)
+    assert callback(first_page_end + 10, None, str(path)) is False
+    assert pool.calls == []
+
+
+class _RangeHttp:
+    """Range 요청을 받은 만큼 206으로 돌려주는 가짜 http"""
+
+    def __init__(self, data):
+        self.data = data
+        self.ranges = []
+
+    def request(self, uri, headers):
+        start, end = map(int, headers["range"][len("bytes="):].split("-"))
+        self.ranges.append(end - start + 1)
+        body = self.data[start:end + 1]
+        resp = {"content-range": f"bytes {start}-{start + len(body) - 1}/{len(self.data)}"}
+        return type("Resp", (dict,), {"status": 206})(resp), body
+
+
+def test_stream_download_keeps_small_chunks_while_progress_asks(dpaa, tmp_path, monkeypatch):
+    monkeypatch.setattr(dpaa, "DRIVE_DOWNLOAD_FIRST_CHUNK_BYTES", 10)
+    monkeypatch.setattr(dpaa, "DRIVE_DOWNLOAD_CHUNK_BYTES", 100)
+    http = _RangeHttp(bytes(range(256)) * 2)
+    answers = iter([True, True, False])
+    dest = tmp_path / "out.pdf"
+    assert dpaa.stream_download(http, "uri", dest, progress=lambda *a: next(answers, False), limiters=None) == 512
+    assert http.ranges[:4] == [10, 10, 10, 100]
+    assert dest.read_bytes() == http.data
+
+
+def test_preview_kept_until_first_real_page_is_drawn(dpaa, monkeypatch):
+    events = []
+    preview_slot = mock.MagicMock()
+    preview_slot.empty.side_effect = lambda: events.append("preview cleared")
+    passed_progress = object()
+
+    def fake_assets(file_id, revision, page_nums, progress=None):
+        assert progress is passed_progress  # 원본을 다시 받는 경우에도 진행률·미리보기를 사용
+        for page_num in page_nums:
+            events.append(f"page {page_num}")
+            yield page_num, {"width": 612, "height": 792, "tiers": {"preview": ["p.jpeg", 10], "1x": ["a.webp", 612]}}
+
+    monkeypatch.setattr(dpaa, "iter_pdf_page_assets", fake_assets)
+    dpaa.render_pdf_pages("file", "rev", 5, progress=passed_progress, placeholders=(preview_slot,))
+    assert events[:2] == ["page 0", "preview cleared"]
@@ -0,0 +1,150 @@
+import threading
+
+import pandas as pd
+import pytest
+
+DECK = "https://docs.google.com/presentation/d/{}/edit"
+PDF = "https://drive.google.com/file/d/{}/view"
+
+
+@pytest.fixture
+def frames(dpaa):
+    archive = dpaa._prepare_archive_df(pd.DataFrame({
+        "IP": ["드라마A", "드라마B", "드라마C"],
+        "프레젠테이션주소": [DECK.format("deck1"), DECK.format("deck1"), DECK.format("deck2")],
+        "주연배우": ["배우1", "배우2", "배우3"],
+        "장르/분석내용": ["로맨스", "스릴러", "사극"],
+        "배우분석": ["1-3", "4-5", "1"],
+        "장르분석": ["6-7", "8", "2"],
+        "배우분석 URL": ["", "", DECK.format("deck3")],
+    }))
+    monthly = dpaa._prepare_monthly_df(pd.DataFrame({
+        "제목": ["1월", "2월"],
+        "날짜": ["2024-01", "2024-02"],
+        "링크": [PDF.format("pdf1"), PDF.format("pdf2")],
+    }))
+    return monthly, archive
+
+
+def test_list_report_sources(dpaa, frames):
+    monthly, archive = frames
+    assert dpaa.list_report_sources(monthly, archive) == [
+        ("pdf1", "pdf"), ("pdf2", "pdf"), ("deck1", "slides"), ("deck3", "slides"), ("deck2", "slides"),
+    ]
+
+
+def test_resolve_report_hit_uses_page_ranges(dpaa, frames):
+    monthly, archive = frames
+    hit = {"source_id": "deck1", "kind": "slides", "page": 4}
+    assert [link["label"] for link in dpaa.resolve_report_hit(hit, monthly, archive)] == ["캐스팅 분석"]
+    links = dpaa.resolve_report_hit({"source_id": "deck1", "kind": "slides", "page": 8}, monthly, archive)
+    assert [(link["title"], link["label"]) for link in links] == [("스릴러 (드라마B)", "장르 분석")]
+    # 배우분석 URL이 따로 있으면 공통 덱(deck2)의 배우 범위는 연결하지 않음
+    assert dpaa.resolve_report_hit({"source_id": "deck2", "kind": "slides", "page": 1}, monthly, archive) == []
+    assert len(dpaa.resolve_report_hit({"source_id": "deck3", "kind": "slides", "page": 1}, monthly, archive)) == 1
+
+    links = dpaa.resolve_report_hit({"source_id": "pdf2", "kind": "pdf", "page": 3}, monthly, archive)
+    assert links == [{"title": "2월", "label": "월간 리포트", "href": f"?view=monthly_detail&id={monthly['stable_id'][1]}&page=3"}]
+
+
+class _Request:
+    def __init__(self, value):
+        self.value = value
+
+    def execute(self):
+        return self.value
+
+
+class _FakeDrive:
+    def __init__(self, revisions):
+        self.revisions = revisions
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields):
+        return _Request({"md5Checksum": self.revisions[fileId]})
+
+
+class _FakeSlides:
+    def __init__(self):
+        self.calls = 0
+
+    def presentations(self):
+        return self
+
+    def get(self, presentationId, fields):
+        self.calls += 1
+        run = {"textRun": {"content": f"{presentationId} 본문 텍스트"}}
+        return _Request({"slides": [{"pageElements": [{"shape": {"text": {"textElements": [run]}}}]}]})
+
+
+def test_index_report_source_skips_unchanged_revision(dpaa, tmp_path, monkeypatch):
+    monkeypatch.setattr(dpaa, "REPORT_INDEX_PATH", tmp_path / "index.sqlite3")
+    slides = _FakeSlides()
+    ctx = {"drive": _FakeDrive({"deck1": "r1"}), "slides": slides, "limiters": dpaa.get_rate_limiters()}
+    conn = dpaa._report_index_connect()
+    try:
+        assert dpaa.index_report_source(conn, ctx, "deck1", "slides") is True
+        assert dpaa.index_report_source(conn, ctx, "deck1", "slides") is False
+        assert slides.calls == 1
+    finally:
+        conn.close()
+    assert dpaa.search_report_text("본문 텍") == [
+        {"source_id": "deck1", "kind": "slides", "page": 1, "snippet": "deck1 <mark>본문 텍</mark>스트"},
+    ]
+
+
+class _StopLoop(Exception):
+    pass
+
+
+class _FakePool:
+    def __init__(self):
+        self.shut = False
+
+    def shutdown(self, wait=True):
+        self.shut = True
+
+
+def test_indexer_replaces_broken_extraction_pool(dpaa, tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    pools = []
+    seen = []
+
+    def fake_index(conn, ctx, source_id, kind):
+        seen.append((source_id, ctx["text_pool"]))
+        if source_id == "pdf1":
+            raise BrokenProcessPool()
+
+    def fake_sleep(seconds):
+        raise _StopLoop()
+
+    monkeypatch.setattr(dpaa, "REPORT_INDEX_PATH", tmp_path / "index.sqlite3")
+    monkeypatch.setattr(dpaa, "_new_text_pool", lambda: pools.append(_FakePool()) or pools[-1])
+    monkeypatch.setattr(dpaa, "build", lambda *args, **kwargs: object())
+    monkeypatch.setattr(dpaa, "index_report_source", fake_index)
+    monkeypatch.setattr(dpaa.time, "sleep", fake_sleep)
+
+    indexer = {
+        "lock": threading.Lock(),
+        "sources": [("pdf1", "pdf"), ("pdf2", "pdf")],
+        "ctx": {"drive_creds": "d", "slides_creds": "s", "limiters": {}},
+    }
+    with pytest.raises(_StopLoop):
+        dpaa.run_report_indexer(indexer)
+    # 워커가 죽은 뒤 다음 파일은 새 추출 풀로 색인하고, 주기가 끝나면 풀을 모두 정리
+    assert len(pools) == 2
+    assert seen == [("pdf1", pools[0]), ("pdf2", pools[1])]
+    assert all(pool.shut for pool in pools)
+
+
+def test_start_report_indexer_refreshes_context(dpaa, frames, monkeypatch):
+    monthly, archive = frames
+    indexer = {"lock": threading.Lock(), "thread": object(), "sources": [], "ctx": {"stale": True}, "versions": None}
+    monkeypatch.setattr(dpaa, "get_report_indexer", lambda: indexer)
+    monkeypatch.setattr(dpaa, "get_google_credentials", lambda scopes: tuple(scopes))
+    dpaa.start_report_indexer(monthly, archive)
+    assert indexer["ctx"] == {"drive_creds": tuple(dpaa.DRIVE_SCOPES), "slides_creds": tuple(dpaa.SLIDES_SCOPES), "limiters": dpaa.get_rate_limiters()}
+    assert ("pdf1", "pdf") in indexer["sources"]
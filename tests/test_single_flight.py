@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+
+def test_concurrent_callers_share_one_call(dpaa):
+    calls = []
+    started = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(dpaa.single_flight, ("sf-test", 1), fetch)
+        started.wait(5)
+        followers = [pool.submit(dpaa.single_flight, ("sf-test", 1), fetch) for _ in range(3)]
+        results = [leader.result()] + [f.result() for f in followers]
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+    # 끝난 호출은 다음 요청에 재사용되지 않음 (결과 캐시가 아니라 진행 중 호출 병합)
+    assert dpaa.single_flight(("sf-test", 1), fetch) == "value"
+    assert len(calls) == 2
+
+
+def test_error_is_shared_and_not_kept(dpaa):
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(dpaa.single_flight, ("sf-test", 2), failing)
+        started.wait(5)
+        follower = pool.submit(dpaa.single_flight, ("sf-test", 2), failing)
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError):
+                future.result()
+    assert dpaa.single_flight(("sf-test", 2), lambda: "recovered") == "recovered"
+
+
+def test_shared_future_reuses_pending_work(dpaa):
+    pending = Future()
+    submits = []
+
+    def submit():
+        submits.append(1)
+        return pending
+
+    assert dpaa.shared_future(("sf-test", 3), submit) is pending
+    assert dpaa.shared_future(("sf-test", 3), submit) is pending
+    pending.set_result("done")
+    # 끝난 작업은 저장소에서 빠지므로 다음 요청은 새로 제출
+    fresh = dpaa.shared_future(("sf-test", 3), submit=lambda: Future())
+    assert fresh is not pending
+    fresh.set_result("again")
+    assert len(submits) == 1
@@ -0,0 +1,25 @@
+import pandas as pd
+
+
+def test_snapshot_round_trip_keeps_frames_and_attrs(dpaa):
+    archive = dpaa._prepare_archive_df(pd.DataFrame({
+        "IP": ["작품A", "작품B"],
+        "주연배우": ["배우1, 배우2", ""],
+        "작성월": ["2024-01", "2024-02"],
+        "비고": [1, 2],
+    }))
+    monthly = dpaa._prepare_monthly_df(pd.DataFrame({
+        "제목": ["1월 리포트"], "발행": ["2024-01"], "링크": ["https://drive.google.com/file/d/abc/view"],
+    }))
+
+    data, version = dpaa.decode_snapshot(dpaa.encode_snapshot({"archive": archive, "monthly": monthly}, "v1"))
+
+    assert version == "v1"
+    pd.testing.assert_frame_equal(data["archive"], archive)
+    pd.testing.assert_frame_equal(data["monthly"], monthly)
+    assert data["archive"].attrs["data_version"] == archive.attrs["data_version"]
+
+
+def test_snapshot_is_plain_json(dpaa):
+    text = dpaa.encode_snapshot({"monthly": pd.DataFrame({"title": ["x"]})}, "")
+    assert text.lstrip().startswith("{")
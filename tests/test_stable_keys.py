@@ -0,0 +1,58 @@
+import random
+
+import pandas as pd
+import pytest
+
+# 공유 링크가 깨지지 않도록 벡터화 버전은 행 단위 make_stable_key와 바이트 단위로 같아야 함
+SPECIAL = [
+    None, float("nan"), "nan", "NaN", " NAN ", "", "   ", 0, 7, -3, 1.0, 2.5, 1e20,
+    "İstanbul", "straße", "ΣΊΣΥΦΟΣ", "ǅ", "K", "Ⅻ", "드라마 A", "  앞뒤 공백  ", "탭\t줄\n바꿈",
+    "a--b__c", "!!!", "x|y", "2024-01-31 00:00:00", "Ä/Ö/Ü", "ｆｕｌｌ", "ﬁ", " nbsp　",
+]
+ALPHABET = "aZ09 _-|.!/가힣İıßΣσςǅÄﬁ\t "
+
+
+def _assert_parity(dpaa, prefix, cols):
+    got = dpaa.make_stable_keys(prefix, *cols)
+    expected = [dpaa.make_stable_key(prefix, *values) for values in zip(*cols)]
+    assert got.tolist() == expected
+    assert got.index.equals(cols[0].index)
+
+
+@pytest.mark.parametrize("dtype", [object, "str"])
+def test_special_values_match_row_wise(dpaa, dtype):
+    values = SPECIAL
+    if dtype == "str":
+        # 문자열 dtype 열은 시트에서 읽은 그대로의 텍스트(결측은 NaN)를 담음
+        values = [v if v is None or isinstance(v, str) else str(v) for v in SPECIAL]
+    left = pd.Series(values, dtype=dtype)
+    right = pd.Series(list(reversed(values)), dtype=dtype)
+    _assert_parity(dpaa, "monthly", [left, right])
+
+
+def test_numeric_columns_match_row_wise(dpaa):
+    ints = pd.Series([0, 1, -5, 10**12])
+    floats = pd.Series([0.0, float("nan"), 3.25, 1e-7])
+    _assert_parity(dpaa, "genre", [ints, floats])
+
+
+def test_seeded_fuzz_matches_row_wise(dpaa):
+    rng = random.Random(1234)
+
+    def value():
+        roll = rng.random()
+        if roll < 0.15:
+            return rng.choice(SPECIAL)
+        if roll < 0.25:
+            return rng.choice([rng.randint(-1000, 1000), rng.uniform(-1e6, 1e6)])
+        return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+
+    for prefix in ("monthly", "actor", ""):
+        cols = [pd.Series([value() for _ in range(500)], dtype=object) for _ in range(rng.randint(1, 4))]
+        _assert_parity(dpaa, prefix, cols)
+
+
+def test_keys_are_truncated_like_row_wise(dpaa):
+    long = pd.Series(["가" * 300, "a b " * 100])
+    _assert_parity(dpaa, "monthly", [long])
+    assert dpaa.make_stable_keys("monthly", long).str.len().max() == 220
@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_drive_thumbnails_return_links_without_waiting_for_proxy(dpaa, monkeypatch):
+    release = threading.Event()
+    proxied = []
+
+    def fake_proxy(creds, source_key, url, width):
+        release.wait(5)
+        proxied.append(source_key)
+        return None
+
+    links = {"a": ("https://thumb/a=s1000", "2024-01-01T00:00:00Z"), "b": ("https://thumb/b=s1000", "")}
+    monkeypatch.setattr(dpaa, "get_drive_thumbnail_links", lambda file_ids: links)
+    monkeypatch.setattr(dpaa, "get_google_credentials", lambda scopes: object())
+    monkeypatch.setattr(dpaa, "get_slides_thumbnail_pool", lambda: pool)
+    monkeypatch.setattr(dpaa, "lookup_proxied_thumbnail", lambda source_key: None)
+    monkeypatch.setattr(dpaa, "proxy_thumbnail", fake_proxy)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        urls = dpaa.get_drive_thumbnail_urls(("a", "b"))
+        # 프록시가 끝나기 전에 원본 썸네일 링크로 바로 반환
+        assert urls == {"a": "https://thumb/a=s1000", "b": "https://thumb/b=s1000"}
+        assert proxied == []
+        release.set()
+    # 수정 시각을 모르는 파일(b)은 프록시·기록하지 않음
+    assert proxied == [("drive", "a", "2024-01-01T00:00:00Z", dpaa.THUMBNAIL_CARD_WIDTH)]
+
+
+def test_drive_thumbnails_use_proxied_url_when_cached(dpaa, monkeypatch):
+    links = {"a": ("https://thumb/a=s1000", "2024-01-01T00:00:00Z")}
+    monkeypatch.setattr(dpaa, "get_drive_thumbnail_links", lambda file_ids: links)
+    monkeypatch.setattr(dpaa, "get_google_credentials", lambda scopes: object())
+    monkeypatch.setattr(dpaa, "lookup_proxied_thumbnail", lambda source_key: "app/static/assets/a.webp")
+    assert dpaa.get_drive_thumbnail_urls(("a",)) == {"a": "app/static/assets/a.webp"}
+
+
+def test_slide_thumbnails_return_content_url_without_waiting_for_proxy(dpaa, monkeypatch):
+    release = threading.Event()
+    proxied = {}
+
+    def fake_proxy(creds, source_key, url, width):
+        release.wait(5)
+        proxied[source_key] = "app/static/assets/" + source_key[3] + ".webp"
+        return proxied[source_key]
+
+    monkeypatch.setattr(dpaa, "get_google_credentials", lambda scopes: object())
+    monkeypatch.setattr(dpaa, "get_slides_thumbnail_pool", lambda: pool)
+    monkeypatch.setattr(dpaa, "_fetch_slide_thumbnail", lambda creds, presentation_id, obj_id: "https://content/" + obj_id)
+    monkeypatch.setattr(dpaa, "lookup_proxied_thumbnail", lambda source_key: proxied.get(source_key))
+    monkeypatch.setattr(dpaa, "proxy_thumbnail", fake_proxy)
+    dpaa._fetch_slide_thumbnail_urls.clear()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # 프록시가 끝나기 전에 contentUrl로 바로 반환
+        assert dpaa.get_slide_thumbnail_urls("deck", "r1", ("p1", "p2")) == ["https://content/p1", "https://content/p2"]
+        assert proxied == {}
+        release.set()
+    # 캐시된 목록이라도 프록시가 끝난 슬라이드는 정적 URL로 바뀜
+    assert dpaa.get_slide_thumbnail_urls("deck", "r1", ("p1", "p2")) == ["app/static/assets/p1.webp", "app/static/assets/p2.webp"]
+    dpaa._fetch_slide_thumbnail_urls.clear()
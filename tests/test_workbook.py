@@ -0,0 +1,115 @@
+import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+# (값, 숫자 서식) — xlsx 셀과 Sheets API 그리드 셀을 같은 내용으로 만듭니다.
+MONTHLY_CELLS = [
+    [("제목", None), ("날짜", None), ("링크", None)],
+    [("1월 리포트", None), (datetime.datetime(2024, 1, 31), ("DATE", "yyyy-mm-dd")), ("https://a", None)],
+    [("2월 리포트", None), (45350, None), ("https://b", None)],
+    [("3월 리포트", None), (3.5, None), ("https://c", None)],
+    [(None, None), (None, None), (None, None)],
+    [("4월 리포트", None), ("2024년 4월", None), ("https://d", None)],
+    [("링크 없음", None), (datetime.datetime(2024, 5, 1, 9, 30), ("DATE_TIME", "yyyy-mm-dd hh:mm")), (None, None)],
+    [("참/거짓", None), (True, None), ("https://e", None), ("메모", None)],
+]
+
+
+def _excel_serial(value: datetime.datetime) -> float:
+    delta = value - datetime.datetime(1899, 12, 30)
+    return delta.days + delta.seconds / 86400
+
+
+def _grid_cell(value, fmt):
+    if value is None:
+        return {}
+    if isinstance(value, bool):
+        return {"effectiveValue": {"boolValue": value}}
+    if isinstance(value, str):
+        return {"effectiveValue": {"stringValue": value}}
+    if isinstance(value, datetime.datetime):
+        value = _excel_serial(value)
+    cell = {"effectiveValue": {"numberValue": float(value)}}
+    if fmt:
+        cell["effectiveFormat"] = {"numberFormat": {"type": fmt[0], "pattern": fmt[1]}}
+    return cell
+
+
+def test_monthly_grid_matches_read_excel(dpaa, tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = dpaa.MONTHLY_SHEET_NAME
+    for r, row in enumerate(MONTHLY_CELLS, start=1):
+        for c, (value, fmt) in enumerate(row, start=1):
+            cell = ws.cell(row=r, column=c, value=value)
+            if fmt:
+                cell.number_format = fmt[1]
+    path = tmp_path / "monthly.xlsx"
+    wb.save(path)
+
+    grid = {"rowData": [{"values": [_grid_cell(v, f) for v, f in row]} for row in MONTHLY_CELLS]}
+    via_api = dpaa._prepare_monthly_df(dpaa._grid_to_excel_frame(grid))
+    via_xlsx = dpaa._prepare_monthly_df(pd.read_excel(path, sheet_name=dpaa.MONTHLY_SHEET_NAME))
+
+    pd.testing.assert_frame_equal(via_api, via_xlsx)
+    assert via_api.attrs["data_version"] == via_xlsx.attrs["data_version"]
+    assert via_api["date"].tolist()[:3] == ["2024-01-31 00:00:00", "45350", "3.5"]
+
+
+def test_quote_sheet_title_escapes_apostrophes(dpaa):
+    assert dpaa.quote_sheet_title("월간") == "'월간'"
+    assert dpaa.quote_sheet_title("Kim's 시트") == "'Kim''s 시트'"
+
+
+class _Call:
+    def __init__(self, log, name, response, **kwargs):
+        log.append((name, kwargs))
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class _FakeSheets:
+    def __init__(self, responses):
+        self.responses = responses
+        self.log = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, **kwargs):
+        name = "grid" if kwargs.get("includeGridData") else "meta"
+        return _Call(self.log, name, self.responses[name], **kwargs)
+
+    def batchGet(self, **kwargs):
+        return _Call(self.log, "batchGet", self.responses["batchGet"], **kwargs)
+
+
+def test_sheets_api_fetches_formatted_archive_and_monthly_grid(dpaa, monkeypatch):
+    grid = {"rowData": [{"values": [_grid_cell(v, f) for v, f in row[:3]]} for row in MONTHLY_CELLS]}
+    service = _FakeSheets({
+        "meta": {"sheets": [
+            {"properties": {"sheetId": 0, "title": "Kim's 아카이브"}},
+            {"properties": {"sheetId": 7, "title": dpaa.MONTHLY_SHEET_NAME}},
+        ]},
+        "batchGet": {"valueRanges": [{"values": [["IP", "작성월"], ["드라마A", "2024-01"]]}]},
+        "grid": {"sheets": [{"data": [grid]}]},
+    })
+    monkeypatch.setattr(dpaa, "get_sheets_service", lambda: service)
+    monkeypatch.setattr(dpaa, "ARCHIVE_SHEET_URL", "https://docs.google.com/spreadsheets/d/abc/edit?gid=0")
+
+    workbook = dpaa._fetch_workbook_via_sheets_api("abc")
+
+    requests = dict(service.log)
+    assert requests["batchGet"]["ranges"] == ["'Kim''s 아카이브'"]
+    assert requests["batchGet"]["valueRenderOption"] == "FORMATTED_VALUE"
+    # 셀 서식은 월간 탭의 A:C에 대해서만 요청
+    assert requests["grid"]["ranges"] == [f"'{dpaa.MONTHLY_SHEET_NAME}'!A:C"]
+    assert "formattedValue" not in requests["grid"]["fields"]
+    assert workbook["archive"]["ip"].tolist() == ["드라마A"]
+    assert workbook["monthly"]["title"].tolist() == ["1월 리포트", "2월 리포트", "3월 리포트", "4월 리포트", "참/거짓"]